@@ -216,6 +216,8 @@ from shared.conflict_detection import (
     get_shared_protection_groups,
 )
 from shared.config_merge import get_effective_launch_config
+from shared.client_registry import get_client, get_client_for_account
+from shared.credential_cache import get_assumed_role_credentials
 from shared.cross_account import (
     get_current_account_id,
     create_drs_client,
@@ -234,6 +236,9 @@ from shared.response_utils import (
 from shared.drs_regions import DRS_REGIONS
 from shared.dynamodb_tables import get_table
 from shared.active_region_filter import get_region_status_table
+from shared.region_fanout import STATUS_ACTIVE, fan_out, set_invocation_deadline
+from shared.shared_cache import CAPACITY_NAMESPACES, NAMESPACE_STAGING_ACCOUNTS, invalidate_namespaces
+from shared.tag_index import resolve_servers_by_tags, sync_tag_index
 from shared.launch_config_service import (
     apply_launch_configs_to_group,
     persist_config_status,
@@ -397,6 +402,9 @@ def lambda_handler(event, context):
     - Tag Sync: {"synch_tags": true, "synch_instance_type": true}
     - Recovery Instance Sync: {"operation": "sync_recovery_instances"}
     """
+    # Regional fan-outs in this invocation share one deadline
+    set_invocation_deadline(context)
+
     try:
         # Detect invocation pattern
         if "requestContext" in event:
@@ -1345,6 +1353,9 @@ def query_inventory_servers_by_tags(account_id: str, region: str, tags: Dict[str
     """
     Query inventory database for servers matching ALL specified tags.
 
+    Uses the inverted tag index when it is current for the account and
+    region; otherwise filters the account's inventory records.
+
     Args:
         account_id: Target account ID
         region: AWS region
@@ -1353,6 +1364,13 @@ def query_inventory_servers_by_tags(account_id: str, region: str, tags: Dict[str
     Returns:
         List of source server IDs matching all tags
     """
+    if region:
+        # Inverted tag index: one query per tag instead of a full account listing
+        indexed = resolve_servers_by_tags(account_id, region, tags)
+        if indexed is not None:
+            print(f"Resolved {len(indexed)} servers from tag index for {account_id}/{region}")
+            return indexed
+
     try:
         print(f"DEBUG: Querying inventory for accountId={account_id}, region={region}, tags={tags}")
         inventory_table = get_inventory_table()
@@ -5911,56 +5929,45 @@ def _get_initialized_drs_regions(account_context: Dict) -> List[str]:
     This is much faster than iterating all 30 DRS regions - it only makes one API call
     per region to check if DRS is initialized (has any source servers).
 
-    Uses concurrent execution to check multiple regions in parallel.
+    Uses the shared region fan-out engine, so the check stops at the
+    invocation deadline and regions that did not answer are skipped.
     """
-    import concurrent.futures
-
     account_id = account_context.get("accountId")
     is_current_account = account_context.get("isCurrentAccount", True)
 
-    def check_region(region: str) -> str:
-        """Check if a region has DRS source servers. Returns region name or None."""
-        try:
-            if is_current_account:
-                drs_client = boto3.client("drs", region_name=region)
-            else:
-                # Cross-account: assume role
-                assume_role_name = account_context.get("assumeRoleName", "DRSOrchestrationRole")
-                external_id = account_context.get("externalId", "drs-orchestration-cross-account")
-                sts_client = boto3.client("sts")
-                role_arn = f"arn:aws:iam::{account_id}:role/{assume_role_name}"
-                assumed = sts_client.assume_role(
-                    RoleArn=role_arn,
-                    RoleSessionName="drs-region-check",
-                    ExternalId=external_id,
-                )
-                creds = assumed["Credentials"]
-                drs_client = boto3.client(
-                    "drs",
-                    region_name=region,
-                    aws_access_key_id=creds["AccessKeyId"],
-                    aws_secret_access_key=creds["SecretAccessKey"],
-                    aws_session_token=creds["SessionToken"],
-                )
-
-            # Quick check - just get 1 server to see if DRS is initialized
-            resp = drs_client.describe_source_servers(maxResults=1)
-            if resp.get("items"):
-                return region
-            return None
-        except Exception:
-            # Region not initialized or access denied - skip it
-            return None
+    def check_region(region: str) -> bool:
+        """Check if a region has DRS source servers."""
+        if is_current_account:
+            drs_client = boto3.client("drs", region_name=region)
+        else:
+            # Cross-account: assume role
+            assume_role_name = account_context.get("assumeRoleName", "DRSOrchestrationRole")
+            external_id = account_context.get("externalId", "drs-orchestration-cross-account")
+            role_arn = f"arn:aws:iam::{account_id}:role/{assume_role_name}"
+            creds = get_assumed_role_credentials(
+                role_arn,
+                external_id=external_id,
+                session_name="drs-region-check",
+                client_factory=boto3.client,
+            )
+            drs_client = boto3.client(
+                "drs",
+                region_name=region,
+                aws_access_key_id=creds["AccessKeyId"],
+                aws_secret_access_key=creds["SecretAccessKey"],
+                aws_session_token=creds["SessionToken"],
+            )
 
-    initialized_regions = []
+        # Quick check - just get 1 server to see if DRS is initialized
+        resp = drs_client.describe_source_servers(maxResults=1)
+        return bool(resp.get("items"))
 
-    # Check regions in parallel (max 10 concurrent)
-    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-        future_to_region = {executor.submit(check_region, r): r for r in DRS_REGIONS}
-        for future in concurrent.futures.as_completed(future_to_region):
-            result = future.result()
-            if result:
-                initialized_regions.append(result)
+    # Region not initialized, access denied or timed out - skip it
+    initialized_regions = [
+        cell["region"]
+        for cell in fan_out(check_region, DRS_REGIONS)
+        if cell["status"] == STATUS_ACTIVE and cell["result"]
+    ]
 
     print(f"Found {len(initialized_regions)} initialized DRS regions: {initialized_regions}")
     return initialized_regions
@@ -6178,9 +6185,8 @@ def sync_tags_in_region(drs_region: str, account_context: dict = None) -> dict:
             "isCurrentAccount": True,
         }
 
-    # Create DRS client with cross-account support
-    drs_client = create_drs_client(drs_region, account_context)
-    ec2_clients = {}
+    # Pooled DRS client with cross-account support (reused across tag sync runs)
+    drs_client = get_client_for_account("drs", drs_region, account_context, client_factory=boto3.client)
 
     # Get all DRS source servers
     source_servers = []
@@ -6213,13 +6219,10 @@ def sync_tags_in_region(drs_region: str, account_context: dict = None) -> dict:
                 skipped_disconnected += 1
                 continue
 
-            # Get or create EC2 client for source region
+            # Get pooled EC2 client for source region
             # EC2 instances are in the target account (same account as DRS servers)
             # Staging account is only used for replication infrastructure
-            ec2_client_key = f"{source_region}"
-            if ec2_client_key not in ec2_clients:
-                ec2_clients[ec2_client_key] = create_ec2_client(source_region, account_context)
-            ec2_client = ec2_clients[ec2_client_key]
+            ec2_client = get_client_for_account("ec2", source_region, account_context, client_factory=boto3.client)
 
             # Get EC2 instance tags
             try:
@@ -8240,6 +8243,9 @@ def handle_add_staging_account(body: Dict) -> Dict:
 
         print(f"Added staging account {staging_account.get('accountId')} " f"to target account {target_account_id}")
 
+        # Capacity and staging discovery cached by the query handler are now stale
+        invalidate_namespaces(*CAPACITY_NAMESPACES, NAMESPACE_STAGING_ACCOUNTS)
+
         return response(200, result)
 
     except ValueError as e:
@@ -8363,6 +8369,8 @@ def handle_remove_staging_account(body: Dict) -> Dict:
 
         print(f"Removed staging account {staging_account_id} " f"from target account {target_account_id}")
 
+        invalidate_namespaces(*CAPACITY_NAMESPACES, NAMESPACE_STAGING_ACCOUNTS)
+
         return response(200, result)
 
     except ValueError as e:
@@ -8560,6 +8568,9 @@ def handle_sync_staging_accounts() -> Dict:
         extend_results = auto_extend_staging_servers(target_accounts, active_regions)
         extend_results["timestamp"] = datetime.now(timezone.utc).isoformat()
 
+        if extend_results.get("serversExtended"):
+            invalidate_namespaces(*CAPACITY_NAMESPACES, NAMESPACE_STAGING_ACCOUNTS)
+
         return response(200, extend_results)
 
     except Exception as e:
@@ -8747,15 +8758,12 @@ def get_extended_source_servers(
 
     # Assume role once, reuse credentials
     try:
-        sts_client = boto3.client("sts")
-        assume_params = {
-            "RoleArn": role_arn,
-            "RoleSessionName": "drs-extend-check",
-            "DurationSeconds": 900,
-        }
-        if external_id:
-            assume_params["ExternalId"] = external_id
-        credentials = sts_client.assume_role(**assume_params)["Credentials"]
+        credentials = get_assumed_role_credentials(
+            role_arn,
+            external_id=external_id,
+            session_name="drs-extend-check",
+            client_factory=boto3.client,
+        )
     except Exception as e:
         print(f"Failed to assume role for {target_account_id}: {e}")
         return extended_arns
@@ -8848,15 +8856,12 @@ def get_staging_account_servers(
     credentials = None
     if not use_default:
         try:
-            sts_client = boto3.client("sts")
-            assume_params = {
-                "RoleArn": role_arn,
-                "RoleSessionName": "drs-staging-query",
-                "DurationSeconds": 900,
-            }
-            if external_id:
-                assume_params["ExternalId"] = external_id
-            credentials = sts_client.assume_role(**assume_params)["Credentials"]
+            credentials = get_assumed_role_credentials(
+                role_arn,
+                external_id=external_id,
+                session_name="drs-staging-query",
+                client_factory=boto3.client,
+            )
         except Exception as e:
             print(f"Failed to assume role for staging {staging_account_id}: {e}")
             return []
@@ -8968,9 +8973,6 @@ def handle_sync_source_server_inventory() -> Dict:
             "timestamp": str
         }
     """
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-    from botocore.config import Config
-
     print("Starting source server inventory sync...")
 
     inventory_table_name = os.environ.get("SOURCE_SERVER_INVENTORY_TABLE")
@@ -8978,7 +8980,6 @@ def handle_sync_source_server_inventory() -> Dict:
         return response(500, {"error": "SOURCE_SERVER_INVENTORY_TABLE not configured"})
 
     inventory_table = boto3.resource("dynamodb").Table(inventory_table_name)
-    fast_config = Config(connect_timeout=5, read_timeout=10, retries={"max_attempts": 1})
     now = datetime.now(timezone.utc).isoformat()
 
     # Get all target accounts
@@ -8995,15 +8996,17 @@ def handle_sync_source_server_inventory() -> Dict:
         ext_id = target.get("externalId")
         current_account = get_current_account_id()
 
-        # Get credentials
-        credentials = None
+        # Resolve role once (cached credentials); clients are pooled per region
+        sync_role_arn = None
         if acct_id != current_account and role_arn:
             try:
-                sts = boto3.client("sts")
-                params = {"RoleArn": role_arn, "RoleSessionName": "inventory-sync", "DurationSeconds": 900}
-                if ext_id:
-                    params["ExternalId"] = ext_id
-                credentials = sts.assume_role(**params)["Credentials"]
+                get_assumed_role_credentials(
+                    role_arn,
+                    external_id=ext_id,
+                    session_name="inventory-sync",
+                    client_factory=boto3.client,
+                )
+                sync_role_arn = role_arn
             except Exception as e:
                 print(f"Cannot assume role for {acct_id}: {e}")
                 continue
@@ -9012,128 +9015,42 @@ def handle_sync_source_server_inventory() -> Dict:
         region_statuses = {}
 
         def query_drs_region(region):
-            try:
-                if credentials:
-                    drs = boto3.client(
-                        "drs",
-                        region_name=region,
-                        aws_access_key_id=credentials["AccessKeyId"],
-                        aws_secret_access_key=credentials["SecretAccessKey"],
-                        aws_session_token=credentials["SessionToken"],
-                        config=fast_config,
-                    )
-                else:
-                    drs = boto3.client("drs", region_name=region, config=fast_config)
-                servers = []
-                paginator = drs.get_paginator("describe_source_servers")
-                for page in paginator.paginate():
-                    for srv in page.get("items", []):
-                        srv["_queryRegion"] = region
-                        srv["_queryAccount"] = acct_id
-                        servers.append(srv)
-                return {
-                    "servers": servers,
-                    "status": "ACTIVE",
-                    "serverCount": len(servers),
-                    "errorMessage": None,
-                }
-            except ClientError as e:
-                code = e.response.get("Error", {}).get("Code", "")
-                msg = str(e)
-                error_msg = e.response.get("Error", {}).get("Message", msg)
-
-                # DRS not initialized
-                if code == "UninitializedAccountException" or "not initialized" in msg.lower():
-                    return {
-                        "servers": [],
-                        "status": "NOT_INITIALIZED",
-                        "serverCount": 0,
-                        "errorMessage": "DRS not initialized in region",
-                    }
-
-                # IAM permission denied
-                if "AccessDeniedException" in msg or code == "AccessDeniedException":
-                    return {
-                        "servers": [],
-                        "status": "IAM_PERMISSION_DENIED",
-                        "serverCount": 0,
-                        "errorMessage": f"IAM permissions denied: {error_msg}",
-                    }
-
-                # Service Control Policy
-                if "service control policy" in msg.lower() or "scp" in msg.lower():
-                    return {
-                        "servers": [],
-                        "status": "SCP_DENIED",
-                        "serverCount": 0,
-                        "errorMessage": "Blocked by Service Control Policy",
-                    }
-
-                # Throttling
-                if code in ["ThrottlingException", "TooManyRequestsException"]:
-                    return {
-                        "servers": [],
-                        "status": "THROTTLED",
-                        "serverCount": 0,
-                        "errorMessage": "API rate limit exceeded",
-                    }
-
-                # Region not opted-in
-                if code == "OptInRequired":
-                    return {
-                        "servers": [],
-                        "status": "REGION_NOT_OPTED_IN",
-                        "serverCount": 0,
-                        "errorMessage": "Region not enabled in account",
-                    }
-
-                # Generic error
-                return {
-                    "servers": [],
-                    "status": "ERROR",
-                    "serverCount": 0,
-                    "errorMessage": f"{code}: {error_msg}" if code else error_msg[:500],
-                }
-            except Exception as e:
-                msg = str(e)
-
-                # Region not enabled
-                if "UnrecognizedClientException" in msg or "security token" in msg.lower():
-                    return {
-                        "servers": [],
-                        "status": "REGION_NOT_ENABLED",
-                        "serverCount": 0,
-                        "errorMessage": "Region not enabled in account",
-                    }
-
-                # Endpoint unreachable
-                if "Could not connect" in msg or "EndpointConnectionError" in msg:
-                    return {
-                        "servers": [],
-                        "status": "ENDPOINT_UNREACHABLE",
-                        "serverCount": 0,
-                        "errorMessage": "Cannot connect to DRS endpoint",
-                    }
-
-                # Generic error
-                return {
-                    "servers": [],
-                    "status": "ERROR",
-                    "serverCount": 0,
-                    "errorMessage": msg[:500],
-                }
+            drs = get_client(
+                "drs",
+                region,
+                role_arn=sync_role_arn,
+                external_id=ext_id,
+                profile="fast",
+                client_factory=boto3.client,
+            )
+            servers = []
+            paginator = drs.get_paginator("describe_source_servers")
+            for page in paginator.paginate():
+                for srv in page.get("items", []):
+                    srv["_queryRegion"] = region
+                    srv["_queryAccount"] = acct_id
+                    servers.append(srv)
+            return servers
 
+        # Errors are classified with the region status vocabulary; regions cut
+        # off by the invocation deadline are recorded as TIMEOUT
         all_servers = []
-        with ThreadPoolExecutor(max_workers=28) as executor:
-            futures = {executor.submit(query_drs_region, r): r for r in DRS_REGIONS}
-            for future in as_completed(futures):
-                region = futures[future]
-                result = future.result()
-                all_servers.extend(result["servers"])
-                region_statuses[region] = {
-                    "status": result["status"],
-                    "serverCount": result["serverCount"],
-                }
+        for cell in fan_out(query_drs_region, DRS_REGIONS):
+            servers = cell["result"] or []
+            all_servers.extend(servers)
+            region_statuses[cell["region"]] = {
+                "status": cell["status"],
+                "serverCount": len(servers),
+                "errorMessage": cell["errorMessage"],
+            }
+
+            # Rebuild the tag index from DRS tags (before EC2 tags are merged in);
+            # regions that could not be listed keep their previous snapshot
+            if cell["status"] in ("ACTIVE", "NOT_INITIALIZED"):
+                try:
+                    sync_tag_index(acct_id, cell["region"], servers, synced_at=now)
+                except Exception as e:
+                    print(f"Error updating tag index for {acct_id}/{cell['region']}: {e}")
 
         # Write region statuses to region status table
         region_status_table = get_region_status_table()
@@ -9201,7 +9118,7 @@ def handle_sync_source_server_inventory() -> Dict:
                 # Get credentials for the source account (where EC2 instances live)
                 current = get_current_account_id()
                 if src_account == current:
-                    ec2 = boto3.client("ec2", region_name=region, config=fast_config)
+                    ec2 = get_client("ec2", region, profile="fast", client_factory=boto3.client)
                 else:
                     # Look up role for source account from target accounts table
                     src_role_arn = f"arn:aws:iam::{src_account}:role/DRSOrchestrationRole"
@@ -9215,20 +9132,13 @@ def handle_sync_source_server_inventory() -> Dict:
                         # Fall back to default cross-account role/external-id. Log so that a
                         # subsequent AssumeRole failure can be traced back to the missing record.
                         print(f"Target account lookup failed for {src_account}, using defaults: {lookup_err}")
-                    sts = boto3.client("sts")
-                    src_creds = sts.assume_role(
-                        RoleArn=src_role_arn,
-                        RoleSessionName="inventory-ec2-query",
-                        ExternalId=src_ext_id,
-                        DurationSeconds=900,
-                    )["Credentials"]
-                    ec2 = boto3.client(
+                    ec2 = get_client(
                         "ec2",
-                        region_name=region,
-                        aws_access_key_id=src_creds["AccessKeyId"],
-                        aws_secret_access_key=src_creds["SecretAccessKey"],
-                        aws_session_token=src_creds["SessionToken"],
-                        config=fast_config,
+                        region,
+                        role_arn=src_role_arn,
+                        external_id=src_ext_id,
+                        profile="fast",
+                        client_factory=boto3.client,
                     )
                 # Batch describe (max 1000 per call)
                 for i in range(0, len(instance_ids), 100):
@@ -9351,6 +9261,9 @@ def handle_sync_source_server_inventory() -> Dict:
         "timestamp": now,
     }
     print(f"Inventory sync: {total_synced} synced, {total_errors} errors")
+
+    # Server counts changed; drop capacity and staging discovery cached by the query handler
+    invalidate_namespaces(*CAPACITY_NAMESPACES, NAMESPACE_STAGING_ACCOUNTS)
     return response(200, result)
 
 
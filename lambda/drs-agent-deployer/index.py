@@ -55,6 +55,8 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 from botocore.exceptions import ClientError
 
+from shared.credential_cache import get_client_kwargs
+
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
@@ -199,6 +201,9 @@ class DRSAgentDeployer:
         """
         Assume cross-account role.
 
+        Credentials come from the shared process-wide credential cache, so
+        repeated deployments to the same account reuse unexpired credentials.
+
         Args:
             role_arn: ARN of role to assume
             session_name: Session name for the assumed role
@@ -208,27 +213,17 @@ class DRSAgentDeployer:
         """
         print(f"Assuming role: {role_arn}")
 
-        sts_client = boto3.client("sts")
-
-        assume_role_params = {
-            "RoleArn": role_arn,
-            "RoleSessionName": session_name,
-        }
-
-        if self.external_id:
-            assume_role_params["ExternalId"] = self.external_id
-
-        response = sts_client.assume_role(**assume_role_params)
+        credentials = get_client_kwargs(
+            role_arn,
+            external_id=self.external_id,
+            session_name=session_name,
+            client_factory=boto3.client,
+        )
 
-        credentials = response["Credentials"]
         account_id = role_arn.split(":")[4]
         print(f"✅ Assumed role in account {account_id}")
 
-        return {
-            "aws_access_key_id": credentials["AccessKeyId"],
-            "aws_secret_access_key": credentials["SecretAccessKey"],
-            "aws_session_token": credentials["SessionToken"],
-        }
+        return credentials
 
     def _get_client(self, service: str, region: str, credentials: Optional[Dict[str, str]]):
         """
@@ -121,6 +121,7 @@ from botocore.exceptions import ClientError
 
 # Import shared utilities
 from shared.account_utils import get_account_name
+from shared.client_registry import get_client, get_client_for_account
 from shared.config_merge import get_effective_launch_config
 from shared.conflict_detection import (
     check_server_conflicts,
@@ -140,6 +141,7 @@ from shared.drs_limits import (
     validate_wave_sizes,
 )
 from shared.execution_utils import can_terminate_execution
+from shared.rate_limiter import get_rate_limiter
 from shared.response_utils import (
     DecimalEncoder,
     response,
@@ -154,6 +156,7 @@ from shared.response_utils import (
     ERROR_STS_ERROR,
     ERROR_INTERNAL_ERROR,
 )
+from shared.tag_index import get_index_account_id, get_tag_index_table, resolve_servers_by_tags
 
 # Initialize AWS clients
 dynamodb = boto3.resource("dynamodb")
@@ -1672,7 +1675,7 @@ def get_server_launch_configurations(region: str, server_ids: List[str]) -> Dict
 
     Fetch launch configurations for all servers in wave from DRS
     """
-    drs_client = boto3.client("drs", region_name=region)
+    drs_client = get_client("drs", region, client_factory=boto3.client)
     configs = {}
 
     for server_id in server_ids:
@@ -1706,8 +1709,15 @@ def get_server_launch_configurations(region: str, server_ids: List[str]) -> Dict
     return configs
 
 
-def start_drs_recovery_with_retry(server_id: str, region: str, is_drill: bool, execution_id: str) -> Dict:
-    """Launch DRS recovery with ConflictException retry logic"""
+def start_drs_recovery_with_retry(
+    server_id: str, region: str, is_drill: bool, execution_id: str, rate_limiter=None
+) -> Dict:
+    """
+    Launch DRS recovery with ConflictException retry logic.
+
+    Throttling is paced by the shared StartRecovery rate limiter (or the
+    injected rate_limiter); ConflictException still waits for the other job.
+    """
     from botocore.exceptions import ClientError
 
     max_retries = 3
@@ -1715,7 +1725,7 @@ def start_drs_recovery_with_retry(server_id: str, region: str, is_drill: bool, e
 
     for attempt in range(max_retries):
         try:
-            return start_drs_recovery(server_id, region, is_drill, execution_id)
+            return start_drs_recovery(server_id, region, is_drill, execution_id, rate_limiter=rate_limiter)
         except ClientError as e:
             error_code = e.response["Error"]["Code"]
 
@@ -1740,15 +1750,21 @@ def start_drs_recovery(
     is_drill: bool,
     execution_id: str,
     execution_type: str = "DRILL",
+    rate_limiter=None,
 ) -> Dict:
     """Launch DRS recovery for a single source server"""
     try:
-        drs_client = boto3.client("drs", region_name=region)
+        drs_client = get_client("drs", region, client_factory=boto3.client)
+        limiter = rate_limiter or get_rate_limiter("drs", region, operation="start_recovery")
 
         print(f"Starting {execution_type} {'drill' if is_drill else 'recovery'} for server {server_id}")
 
         # Start recovery job
-        response = drs_client.start_recovery(sourceServers=[{"sourceServerID": server_id}], isDrill=is_drill)
+        response = limiter.call(
+            drs_client.start_recovery,
+            sourceServers=[{"sourceServerID": server_id}],
+            isDrill=is_drill,
+        )
 
         job = response.get("job", {})
         job_id = job.get("jobID", "unknown")
@@ -1820,7 +1836,14 @@ def start_drs_recovery_for_wave(
         print(f"[DRS API]   sourceServers: {len(source_servers)} servers")
         print(f"[DRS API]   isDrill: {is_drill}")
 
-        response = drs_client.start_recovery(
+        # Paced per target account/region so parallel waves share the StartRecovery budget
+        target_account_id = None
+        if account_context and not account_context.get("isCurrentAccount", True):
+            target_account_id = account_context.get("accountId")
+        limiter = get_rate_limiter("drs", region, target_account_id, "start_recovery")
+
+        response = limiter.call(
+            drs_client.start_recovery,
             sourceServers=source_servers,
             isDrill=is_drill,
         )
@@ -2156,7 +2179,15 @@ def start_wave_recovery(state: Dict, wave_number: int) -> None:
         if not server_ids:
             # Tag-based protection groups: resolve servers from inventory
             selection_tags = pg.get("serverSelectionTags", {})
-            if selection_tags:
+            account_context = state.get("accountContext") or state.get("account_context", {})
+            indexed = None
+            if selection_tags and get_tag_index_table() is not None:
+                # Inverted tag index: intersect a few indexed lookups
+                indexed = resolve_servers_by_tags(get_index_account_id(account_context), region, selection_tags)
+                if indexed is not None:
+                    server_ids = indexed
+                    print(f"Resolved {len(server_ids)} servers from tag index for wave {wave_number}")
+            if selection_tags and indexed is None:
                 try:
                     from shared.inventory_query import query_inventory_by_regions
 
@@ -2170,7 +2201,6 @@ def start_wave_recovery(state: Dict, wave_number: int) -> None:
                     print(f"Resolved {len(server_ids)} servers from inventory tags for wave {wave_number}")
                 except Exception as e:
                     print(f"Inventory tag resolution failed, trying DRS API: {e}")
-                    account_context = state.get("accountContext") or state.get("account_context", {})
                     try:
                         resolved = query_drs_servers_by_tags(region, selection_tags, account_context)
                         server_ids = [s.get("sourceServerID") for s in resolved if s.get("sourceServerID")]
@@ -7564,16 +7594,8 @@ def reconcile_wave_status_with_drs(execution: Dict, account_context: Optional[Di
                     # Query DRS for actual job status - REAL-TIME
                     region = wave.get("region", "us-east-1")
 
-                    # Create DRS client with cross-account credentials if provided
-                    if account_context:
-                        from shared.cross_account import create_drs_client
-
-                        # Use create_drs_client helper which properly handles accountContext structure
-                        drs_client = create_drs_client(region, account_context)
-                        print(f"DEBUG: Created cross-account DRS client for region {region}")
-                    else:
-                        drs_client = boto3.client("drs", region_name=region)
-                        print(f"DEBUG: Created local DRS client for region {region}")
+                    # Pooled DRS client (cross-account credentials if account_context provided)
+                    drs_client = get_client_for_account("drs", region, account_context, client_factory=boto3.client)
 
                     response = drs_client.describe_jobs(filters={"jobIDs": [job_id]})
 
@@ -7817,17 +7839,10 @@ def reconcile_wave_status_with_drs(execution: Dict, account_context: Optional[Di
 
                                 if ec2_instance_ids:
                                     try:
-                                        # Create EC2 client with cross-account credentials if provided
-                                        if account_context:
-                                            from shared.cross_account import (
-                                                create_ec2_client,
-                                            )
-
-                                            # Use create_ec2_client helper which properly handles accountContext structure
-                                            ec2_client = create_ec2_client(region, account_context)
-                                            print(f"DEBUG: Created cross-account EC2 client for region {region}")
-                                        else:
-                                            ec2_client = boto3.client("ec2", region_name=region)
+                                        # Pooled EC2 client (cross-account if account_context provided)
+                                        ec2_client = get_client_for_account(
+                                            "ec2", region, account_context, client_factory=boto3.client
+                                        )
 
                                         ec2_response = ec2_client.describe_instances(InstanceIds=ec2_instance_ids)
 
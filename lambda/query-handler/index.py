@@ -316,7 +316,6 @@ import os
 import time
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import boto3
 from botocore.exceptions import ClientError
@@ -331,6 +330,7 @@ from shared.account_utils import (  # noqa: E402
     get_account_name,
     get_target_accounts,
 )
+from shared.credential_cache import get_assumed_role_credentials  # noqa: E402
 from shared.cross_account import (  # noqa: E402
     create_drs_client,
     get_cross_account_session,
@@ -346,6 +346,25 @@ from shared.dynamodb_tables import get_table  # noqa: E402
 from shared.drs_utils import (  # noqa: E402
     map_replication_state_to_display,
 )
+from shared.region_fanout import (  # noqa: E402
+    STATUS_ACTIVE,
+    UNAVAILABLE_REGION_STATUSES,
+    fan_out,
+    set_invocation_deadline,
+)
+from shared.response_cache import ResponseCache  # noqa: E402
+from shared.shared_cache import (  # noqa: E402
+    NAMESPACE_ALL_ACCOUNTS_CAPACITY,
+    NAMESPACE_COMBINED_CAPACITY,
+    NAMESPACE_DRS_REGIONAL_CAPACITY,
+    NAMESPACE_EC2_INSTANCE_PROFILES,
+    NAMESPACE_EC2_INSTANCE_TYPES,
+    NAMESPACE_EC2_SECURITY_GROUPS,
+    NAMESPACE_EC2_SUBNETS,
+    NAMESPACE_STAGING_ACCOUNTS,
+    get_shared_cache,
+)
+from shared.tag_index import get_index_account_id, get_tag_index_table, resolve_servers_by_tags  # noqa: E402
 from shared.response_utils import (  # noqa: E402
     response,
     error_response,
@@ -394,13 +413,33 @@ _recovery_instances_table = None
 # Response Caching for Performance Optimization
 # ============================================================================
 
-# In-memory cache for expensive API calls (capacity queries)
-# Cache structure: {cache_key: {"data": response_data, "timestamp": unix_time}}
-_response_cache = {}
+# Bounded in-memory cache for expensive API calls (capacity, staging
+# discovery and EC2/IAM dropdown data), backed by the cross-container
+# DynamoDB tier when RESPONSE_CACHE_TABLE is set. Keys are "namespace:..." so
+# clear_cache() can drop one namespace without scanning every key.
+_response_cache = ResponseCache(max_entries=512, name="query-handler", shared_tier=get_shared_cache())
 
 # Cache TTL in seconds (30 seconds for capacity data)
 CACHE_TTL_CAPACITY = 30
 
+# Subnets, security groups and instance profiles change rarely; dropdowns
+# can show data up to 5 minutes old (10 more while refreshing)
+CACHE_TTL_EC2_RESOURCES = 300
+CACHE_STALE_TTL_EC2_RESOURCES = 600
+
+# Staging discovery scans every region of the target account; sync jobs
+# invalidate it when staging accounts change
+CACHE_TTL_STAGING_DISCOVERY = 300
+
+# Instance type catalog per region only changes with new EC2 launches
+CACHE_TTL_INSTANCE_TYPES = 3600
+CACHE_STALE_TTL_INSTANCE_TYPES = 3600
+
+
+def _is_success_response(result: Dict) -> bool:
+    """Only cache successful API Gateway responses."""
+    return isinstance(result, dict) and result.get("statusCode") == 200
+
 
 # ============================================================================
 # Lazy Initialization Getters for DynamoDB Tables
@@ -470,57 +509,50 @@ def get_cached_response(cache_key: str, ttl: int = CACHE_TTL_CAPACITY) -> Option
 
     Args:
         cache_key: Unique key for the cached data
-        ttl: Time-to-live in seconds
+        ttl: Time-to-live in seconds (entries carry the TTL they were stored
+            with; kept for backward compatibility)
 
     Returns:
         Cached data if valid, None if expired or not found
     """
-    if cache_key not in _response_cache:
-        return None
-
-    cached = _response_cache[cache_key]
-    age = time.time() - cached["timestamp"]
-
-    if age > ttl:
-        # Cache expired, remove it
-        del _response_cache[cache_key]
-        return None
+    data = _response_cache.get(cache_key)
+    if data is not None:
+        print(f"Cache HIT for {cache_key}")
+    return data
 
-    print(f"Cache HIT for {cache_key} (age: {age:.1f}s)")
-    return cached["data"]
 
-
-def set_cached_response(cache_key: str, data: Dict) -> None:
+def set_cached_response(cache_key: str, data: Dict, ttl: int = CACHE_TTL_CAPACITY) -> None:
     """
-    Store response in cache with current timestamp.
+    Store response in cache.
 
     Args:
         cache_key: Unique key for the cached data
         data: Response data to cache
+        ttl: Time-to-live in seconds
     """
-    _response_cache[cache_key] = {"data": data, "timestamp": time.time()}
+    _response_cache.set(cache_key, data, ttl=ttl)
     print(f"Cache SET for {cache_key}")
 
 
 def clear_cache(pattern: Optional[str] = None) -> None:
     """
-    Clear cache entries matching pattern, or all if no pattern.
+    Clear cache entries in a namespace, or all if no namespace.
 
     Args:
-        pattern: Optional string pattern to match cache keys
+        pattern: Optional key namespace (e.g. "combined_capacity")
     """
-    global _response_cache
+    count = _response_cache.invalidate(pattern)
     if pattern:
-        keys_to_delete = [k for k in _response_cache.keys() if pattern in k]
-        for key in keys_to_delete:
-            del _response_cache[key]
-        print(f"Cleared {len(keys_to_delete)} cache entries matching '{pattern}'")
+        print(f"Cleared {count} cache entries in namespace '{pattern}'")
     else:
-        count = len(_response_cache)
-        _response_cache = {}
         print(f"Cleared all {count} cache entries")
 
 
+def get_cache_stats() -> Dict:
+    """Return in-memory and shared cache hit/miss/eviction counters."""
+    return {**_response_cache.get_stats(), "shared": get_shared_cache().get_stats()}
+
+
 # ============================================================================
 # Helper Functions
 # ============================================================================
@@ -563,6 +595,9 @@ def query_drs_servers_by_tags(  # noqa: C901
     - Whitespace is stripped from keys and values
     - Tags are read from DRS source server metadata, not EC2 instance
       tags
+    - Served from the inverted tag index (shared.tag_index) when the
+      inventory sync has indexed the region recently; otherwise the
+      region is listed from the DRS API
 
     Args:
         region: AWS region to query DRS servers
@@ -578,6 +613,13 @@ def query_drs_servers_by_tags(  # noqa: C901
         # Returns only servers with BOTH tags matching
     """
     try:
+        # Inverted tag index maintained by inventory sync; None means stale or unavailable
+        if get_tag_index_table() is not None:
+            indexed = resolve_servers_by_tags(get_index_account_id(account_context), region, tags)
+            if indexed is not None:
+                print(f"Resolved {len(indexed)} servers matching tags {tags} from tag index")
+                return indexed
+
         # Create DRS client with cross-account support
         regional_drs = create_drs_client(region, account_context)
 
@@ -671,6 +713,9 @@ def lambda_handler(event, context):
         "state": {...}
     }
     """
+    # Regional fan-outs in this invocation share one deadline
+    set_invocation_deadline(context)
+
     try:
         # Import IAM utilities for principal extraction
         from shared.iam_utils import extract_iam_principal
@@ -1899,8 +1944,19 @@ def get_drs_regional_capacity(region: str) -> Dict:
     - `get_drs_account_capacity_all_regions()`: Account-wide capacity across all regions
     - `get_drs_account_capacity()`: Single-region capacity with API Gateway wrapper
 
-    Get DRS capacity metrics for a specific region
+    Get DRS capacity metrics for a specific region.
+    Successful results are cached for CACHE_TTL_CAPACITY seconds.
     """
+    return _response_cache.get_or_compute(
+        f"{NAMESPACE_DRS_REGIONAL_CAPACITY}:{region}",
+        lambda: _query_drs_regional_capacity(region),
+        ttl=CACHE_TTL_CAPACITY,
+        cacheable=lambda result: result.get("status") in ("OK", "NOT_INITIALIZED"),
+    )
+
+
+def _query_drs_regional_capacity(region: str) -> Dict:
+    """Query DRS source server counts for a region (uncached)."""
     try:
         regional_drs = boto3.client("drs", region_name=region)
         # Get current account ID for filtering extended source servers
@@ -1991,7 +2047,8 @@ def get_drs_account_capacity_all_regions(
     ## Behavior
 
     ### Concurrent Regional Queries
-    1. Queries all 15 DRS regions concurrently (max 10 threads)
+    1. Queries all DRS regions concurrently via shared.region_fanout, bounded
+       by the invocation deadline (unfinished regions are reported as failed)
     2. Priority regions queried first (us-east-1, us-east-2, us-west-1, us-west-2)
     3. Skips uninitialized regions silently (no error)
     4. Aggregates results across all regions
@@ -2077,7 +2134,7 @@ def get_drs_account_capacity_all_regions(
     - Large deployment (300+ servers): 10-15 seconds
 
     ### Concurrency
-    - Max 10 concurrent region queries
+    - Shared fan-out engine (one worker per region, invocation-wide deadline)
     - Priority regions queried first for faster response
     - Uninitialized regions skipped immediately
 
@@ -2105,75 +2162,51 @@ def get_drs_account_capacity_all_regions(
     failed_regions = []
 
     def query_region(region: str) -> Dict:
-        """Query a single region and return results"""
-        try:
-            regional_drs = create_drs_client(region, account_context)
-            # Get account ID from context or current account
-            account_id = account_context.get("accountId") if account_context else get_current_account_id()
-            counts = _count_drs_servers(regional_drs, account_id)
-            return {
-                "success": True,
-                "region": region,
-                "totalServers": counts["totalServers"],
-                "replicatingServers": counts["replicatingServers"],
-            }
-        except Exception as e:
-            error_str = str(e)
-            # Skip uninitialized regions and opt-in regions silently
-            if (
-                "UninitializedAccountException" in error_str
-                or "not initialized" in error_str.lower()
-                or "UnrecognizedClientException" in error_str
-                or "security token" in error_str.lower()
-            ):
-                return {
-                    "success": True,
-                    "region": region,
-                    "totalServers": 0,
-                    "replicatingServers": 0,
-                }
-
-            print(f"ERROR: Failed to query DRS in {region}: {e}")
-            return {"success": False, "region": region, "error": str(e)}
-
-    # Query all regions concurrently (max 10 threads to avoid overwhelming API)
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        future_to_region = {executor.submit(query_region, region): region for region in all_regions_ordered}
-
-        for future in as_completed(future_to_region):
-            result = future.result()
+        """Query a single region and return server counts"""
+        regional_drs = create_drs_client(region, account_context)
+        # Get account ID from context or current account
+        account_id = account_context.get("accountId") if account_context else get_current_account_id()
+        return _count_drs_servers(regional_drs, account_id)
 
-            if result["success"]:
-                if result["totalServers"] > 0:
-                    # Calculate per-region status (each region has 300 limit)
-                    region_replicating = result["replicatingServers"]
-                    region_max = DRS_LIMITS["MAX_REPLICATING_SERVERS"]
+    # Query all regions concurrently under the invocation deadline
+    for cell in fan_out(query_region, all_regions_ordered):
+        if cell["status"] in UNAVAILABLE_REGION_STATUSES:
+            # Skip uninitialized regions and opt-in regions silently
+            continue
+        if cell["status"] != STATUS_ACTIVE:
+            print(f"ERROR: Failed to query DRS in {cell['region']}: {cell['status']} - {cell['errorMessage']}")
+            failed_regions.append(cell["region"])
+            continue
 
-                    if region_replicating >= region_max:
-                        region_status = "CRITICAL"
-                    elif region_replicating >= DRS_LIMITS["CRITICAL_REPLICATING_THRESHOLD"]:
-                        region_status = "WARNING"
-                    elif region_replicating >= DRS_LIMITS["WARNING_REPLICATING_THRESHOLD"]:
-                        region_status = "INFO"
-                    else:
-                        region_status = "OK"
+        result = cell["result"]
+        if result["totalServers"] > 0:
+            # Calculate per-region status (each region has 300 limit)
+            region_replicating = result["replicatingServers"]
+            region_max = DRS_LIMITS["MAX_REPLICATING_SERVERS"]
+
+            if region_replicating >= region_max:
+                region_status = "CRITICAL"
+            elif region_replicating >= DRS_LIMITS["CRITICAL_REPLICATING_THRESHOLD"]:
+                region_status = "WARNING"
+            elif region_replicating >= DRS_LIMITS["WARNING_REPLICATING_THRESHOLD"]:
+                region_status = "INFO"
+            else:
+                region_status = "OK"
 
-                    regional_breakdown.append(
-                        {
-                            "region": result["region"],
-                            "totalServers": result["totalServers"],
-                            "replicatingServers": region_replicating,
-                            "maxReplicating": region_max,
-                            "availableSlots": max(0, region_max - region_replicating),
-                            "percentUsed": round((region_replicating / region_max) * 100, 1),
-                            "status": region_status,
-                        }
-                    )
+            regional_breakdown.append(
+                {
+                    "region": cell["region"],
+                    "totalServers": result["totalServers"],
+                    "replicatingServers": region_replicating,
+                    "maxReplicating": region_max,
+                    "availableSlots": max(0, region_max - region_replicating),
+                    "percentUsed": round((region_replicating / region_max) * 100, 1),
+                    "status": region_status,
+                }
+            )
 
-                total_servers += result["totalServers"]
-                replicating_servers += result["replicatingServers"]
-            else:
-                failed_regions.append(result["region"])
+        total_servers += result["totalServers"]
+        replicating_servers += result["replicatingServers"]
 
     # Determine overall status based on worst region status
     # Each region has its own 300-server quota, so we check per-region
@@ -2714,7 +2747,8 @@ def get_ec2_subnets(query_params: Dict) -> Dict:
     """
     Get VPC subnets for dropdown selection.
 
-    Supports cross-account queries when accountId is provided.
+    Supports cross-account queries when accountId is provided. Successful
+    responses are cached per account and region.
     """
     region = query_params.get("region")
     account_id = query_params.get("accountId")
@@ -2731,6 +2765,17 @@ def get_ec2_subnets(query_params: Dict) -> Dict:
             ),
         )
 
+    return _response_cache.get_or_compute(
+        f"{NAMESPACE_EC2_SUBNETS}:{account_id or 'current'}:{region}",
+        lambda: _query_ec2_subnets(region, account_id),
+        ttl=CACHE_TTL_EC2_RESOURCES,
+        stale_ttl=CACHE_STALE_TTL_EC2_RESOURCES,
+        cacheable=_is_success_response,
+    )
+
+
+def _query_ec2_subnets(region: str, account_id: Optional[str]) -> Dict:
+    """Describe VPC subnets and build the dropdown response (uncached)."""
     try:
         # Use cross-account credentials if accountId provided
         if account_id:
@@ -2797,7 +2842,7 @@ def get_ec2_subnets(query_params: Dict) -> Dict:
 
 
 def get_ec2_security_groups(query_params: Dict) -> Dict:
-    """Get security groups for dropdown selection"""
+    """Get security groups for dropdown selection (cached per account, region and VPC)"""
     region = query_params.get("region")
     vpc_id = query_params.get("vpcId")  # Optional filter
     account_id = query_params.get("accountId")  # Optional cross-account
@@ -2812,6 +2857,17 @@ def get_ec2_security_groups(query_params: Dict) -> Dict:
             ),
         )
 
+    return _response_cache.get_or_compute(
+        f"{NAMESPACE_EC2_SECURITY_GROUPS}:{account_id or 'current'}:{region}:{vpc_id or 'all'}",
+        lambda: _query_ec2_security_groups(region, vpc_id, account_id),
+        ttl=CACHE_TTL_EC2_RESOURCES,
+        stale_ttl=CACHE_STALE_TTL_EC2_RESOURCES,
+        cacheable=_is_success_response,
+    )
+
+
+def _query_ec2_security_groups(region: str, vpc_id: Optional[str], account_id: Optional[str]) -> Dict:
+    """Describe security groups and build the dropdown response (uncached)."""
     try:
         # Use cross-account session if accountId provided
         if account_id:
@@ -2867,7 +2923,7 @@ def get_ec2_security_groups(query_params: Dict) -> Dict:
 
 
 def get_ec2_instance_profiles(query_params: Dict) -> Dict:
-    """Get IAM instance profiles for dropdown selection"""
+    """Get IAM instance profiles for dropdown selection (cached per account)"""
     region = query_params.get("region")
     account_id = query_params.get("accountId")  # Optional cross-account
 
@@ -2881,6 +2937,18 @@ def get_ec2_instance_profiles(query_params: Dict) -> Dict:
             ),
         )
 
+    # IAM is global, so profiles are cached per account rather than per region
+    return _response_cache.get_or_compute(
+        f"{NAMESPACE_EC2_INSTANCE_PROFILES}:{account_id or 'current'}",
+        lambda: _query_ec2_instance_profiles(region, account_id),
+        ttl=CACHE_TTL_EC2_RESOURCES,
+        stale_ttl=CACHE_STALE_TTL_EC2_RESOURCES,
+        cacheable=_is_success_response,
+    )
+
+
+def _query_ec2_instance_profiles(region: str, account_id: Optional[str]) -> Dict:
+    """List IAM instance profiles and build the dropdown response (uncached)."""
     try:
         # Use cross-account session if accountId provided
         if account_id:
@@ -2930,7 +2998,7 @@ def get_ec2_instance_profiles(query_params: Dict) -> Dict:
 
 
 def get_ec2_instance_types(query_params: Dict) -> Dict:
-    """Get ALL EC2 instance types available in the specified region for DRS launch settings"""
+    """Get ALL EC2 instance types available in the specified region for DRS launch settings (cached per region)"""
     region = query_params.get("region")
 
     if not region:
@@ -2943,6 +3011,17 @@ def get_ec2_instance_types(query_params: Dict) -> Dict:
             ),
         )
 
+    return _response_cache.get_or_compute(
+        f"{NAMESPACE_EC2_INSTANCE_TYPES}:{region}",
+        lambda: _query_ec2_instance_types(region),
+        ttl=CACHE_TTL_INSTANCE_TYPES,
+        stale_ttl=CACHE_STALE_TTL_INSTANCE_TYPES,
+        cacheable=_is_success_response,
+    )
+
+
+def _query_ec2_instance_types(region: str) -> Dict:
+    """Describe instance types available in a region (uncached)."""
     try:
         ec2 = boto3.client("ec2", region_name=region)
 
@@ -4649,8 +4728,6 @@ def query_account_capacity(account_config: Dict) -> Dict:
 
     Requirements: 9.2, 9.3, 9.4
     """
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-
     account_id = account_config.get("accountId")
     account_name = account_config.get("accountName", "Unknown")
     account_type = account_config.get("accountType", "staging")
@@ -4683,15 +4760,12 @@ def query_account_capacity(account_config: Dict) -> Dict:
             print(f"Assuming role {role_arn} in account {account_id}")
 
             try:
-                sts_client = boto3.client("sts")
-                assumed_role = sts_client.assume_role(
-                    RoleArn=role_arn,
-                    RoleSessionName="drs-orchestration-capacity-query",
-                    ExternalId=external_id,
-                    DurationSeconds=900,  # 15 minutes
+                credentials = get_assumed_role_credentials(
+                    role_arn,
+                    external_id=external_id,
+                    session_name="drs-orchestration-capacity-query",
+                    client_factory=boto3.client,
                 )
-
-                credentials = assumed_role["Credentials"]
                 print(f"Successfully assumed role in account {account_id}")
 
             except ClientError as e:
@@ -4726,81 +4800,52 @@ def query_account_capacity(account_config: Dict) -> Dict:
 
         def query_region(region: str) -> Dict:
             """Query a single region for DRS capacity."""
-            try:
-                # Create DRS client with short timeouts
-                if credentials:
-                    drs_client = boto3.client(
-                        "drs",
-                        region_name=region,
-                        aws_access_key_id=credentials["AccessKeyId"],
-                        aws_secret_access_key=credentials["SecretAccessKey"],
-                        aws_session_token=credentials["SessionToken"],
-                        config=fast_config,
-                    )
-                else:
-                    drs_client = boto3.client("drs", region_name=region, config=fast_config)
-
-                # Count servers in this region
-                server_counts = _count_drs_servers(drs_client, account_id)
-
-                return {
-                    "region": region,
-                    "totalServers": server_counts["totalServers"],
-                    "replicatingServers": server_counts["replicatingServers"],
-                    "error": None,
-                }
+            # Create DRS client with short timeouts
+            if credentials:
+                drs_client = boto3.client(
+                    "drs",
+                    region_name=region,
+                    aws_access_key_id=credentials["AccessKeyId"],
+                    aws_secret_access_key=credentials["SecretAccessKey"],
+                    aws_session_token=credentials["SessionToken"],
+                    config=fast_config,
+                )
+            else:
+                drs_client = boto3.client("drs", region_name=region, config=fast_config)
 
-            except ClientError as e:
-                error_code = e.response["Error"]["Code"]
-                error_message = e.response["Error"]["Message"]
+            # Count servers in this region
+            return _count_drs_servers(drs_client, account_id)
 
-                # Handle uninitialized regions gracefully
-                if error_code == "UninitializedAccountException" or "not initialized" in error_message.lower():
-                    print(f"DRS not initialized in {region} for account {account_id} - treating as zero servers")
-                    return {
+        # Query all regions in parallel under the invocation deadline
+        regional_results = []
+        for cell in fan_out(query_region, DRS_REGIONS):
+            region = cell["region"]
+            if cell["status"] == STATUS_ACTIVE:
+                regional_results.append(
+                    {
                         "region": region,
-                        "totalServers": 0,
-                        "replicatingServers": 0,
+                        "totalServers": cell["result"]["totalServers"],
+                        "replicatingServers": cell["result"]["replicatingServers"],
                         "error": None,
                     }
-                else:
-                    print(f"Error querying {region} for account {account_id}: {error_code} - {error_message}")
-                    return {
-                        "region": region,
-                        "totalServers": 0,
-                        "replicatingServers": 0,
-                        "error": error_message,
-                    }
+                )
+                continue
 
-            except Exception as e:
-                print(f"Unexpected error querying {region} for account {account_id}: {e}")
-                return {
+            # Handle uninitialized regions gracefully
+            if cell["status"] in UNAVAILABLE_REGION_STATUSES:
+                print(f"DRS {cell['status']} in {region} for account {account_id} - treating as zero servers")
+                error = None
+            else:
+                print(f"Error querying {region} for account {account_id}: {cell['status']} - {cell['errorMessage']}")
+                error = cell["errorMessage"]
+            regional_results.append(
+                {
                     "region": region,
                     "totalServers": 0,
                     "replicatingServers": 0,
-                    "error": str(e),
+                    "error": error,
                 }
-
-        # Query all 28 regions in parallel
-        regional_results = []
-        with ThreadPoolExecutor(max_workers=28) as executor:
-            futures = {executor.submit(query_region, region): region for region in DRS_REGIONS}
-
-            for future in as_completed(futures):
-                region = futures[future]
-                try:
-                    result = future.result()
-                    regional_results.append(result)
-                except Exception as e:
-                    print(f"Failed to get result for region {region}: {e}")
-                    regional_results.append(
-                        {
-                            "region": region,
-                            "totalServers": 0,
-                            "replicatingServers": 0,
-                            "error": str(e),
-                        }
-                    )
+            )
 
         # Step 3: Aggregate results
         total_servers = sum(r["totalServers"] for r in regional_results)
@@ -4855,8 +4900,6 @@ def query_staging_accounts_from_target(target_account: Dict, staging_accounts: L
     Returns:
         List of staging account capacity results
     """
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-
     target_id = target_account.get("accountId")
     role_arn = target_account.get("roleArn")
     external_id = target_account.get("externalId")
@@ -4866,14 +4909,12 @@ def query_staging_accounts_from_target(target_account: Dict, staging_accounts: L
     try:
         # Assume role in target account
         if role_arn and external_id:
-            sts_client = boto3.client("sts")
-            assumed_role = sts_client.assume_role(
-                RoleArn=role_arn,
-                RoleSessionName="drs-orchestration-staging-query",
-                ExternalId=external_id,
-                DurationSeconds=900,
+            credentials = get_assumed_role_credentials(
+                role_arn,
+                external_id=external_id,
+                session_name="drs-orchestration-staging-query",
+                client_factory=boto3.client,
             )
-            credentials = assumed_role["Credentials"]
         else:
             credentials = None
 
@@ -4888,77 +4929,60 @@ def query_staging_accounts_from_target(target_account: Dict, staging_accounts: L
 
         def query_region_for_staging(region: str) -> Dict:
             """Query a region for extended source servers grouped by staging account."""
-            try:
-                if credentials:
-                    drs_client = boto3.client(
-                        "drs",
-                        region_name=region,
-                        aws_access_key_id=credentials["AccessKeyId"],
-                        aws_secret_access_key=credentials["SecretAccessKey"],
-                        aws_session_token=credentials["SessionToken"],
-                        config=fast_config,
-                    )
-                else:
-                    drs_client = boto3.client("drs", region_name=region, config=fast_config)
+            if credentials:
+                drs_client = boto3.client(
+                    "drs",
+                    region_name=region,
+                    aws_access_key_id=credentials["AccessKeyId"],
+                    aws_secret_access_key=credentials["SecretAccessKey"],
+                    aws_session_token=credentials["SessionToken"],
+                    config=fast_config,
+                )
+            else:
+                drs_client = boto3.client("drs", region_name=region, config=fast_config)
 
-                # Count servers by staging account
-                staging_counts = {}
-                paginator = drs_client.get_paginator("describe_source_servers")
+            # Count servers by staging account
+            staging_counts = {}
+            paginator = drs_client.get_paginator("describe_source_servers")
 
-                for page in paginator.paginate():
-                    for server in page.get("items", []):
-                        staging_area = server.get("stagingArea", {})
-                        staging_account_id = staging_area.get("stagingAccountID", "")
-
-                        # Only count extended source servers (staging account != target account)
-                        if staging_account_id and staging_account_id != target_id:
-                            if staging_account_id not in staging_counts:
-                                staging_counts[staging_account_id] = {
-                                    "total": 0,
-                                    "replicating": 0,
-                                }
-
-                            staging_counts[staging_account_id]["total"] += 1
-
-                            # Check if replicating
-                            replication_state = server.get("dataReplicationInfo", {}).get("dataReplicationState", "")
-                            if replication_state in [
-                                "CONTINUOUS",
-                                "INITIAL_SYNC",
-                                "RESCAN",
-                                "INITIATING",
-                                "CREATING_SNAPSHOT",
-                                "BACKLOG",
-                            ]:
-                                staging_counts[staging_account_id]["replicating"] += 1
-
-                return {"region": region, "staging_counts": staging_counts}
+            for page in paginator.paginate():
+                for server in page.get("items", []):
+                    staging_area = server.get("stagingArea", {})
+                    staging_account_id = staging_area.get("stagingAccountID", "")
+
+                    # Only count extended source servers (staging account != target account)
+                    if staging_account_id and staging_account_id != target_id:
+                        if staging_account_id not in staging_counts:
+                            staging_counts[staging_account_id] = {
+                                "total": 0,
+                                "replicating": 0,
+                            }
 
-            except ClientError as e:
-                error_code = e.response["Error"]["Code"]
-                if error_code == "UninitializedAccountException" or "not initialized" in str(e):
-                    return {"region": region, "staging_counts": {}}
-                print(f"Error querying {region}: {e}")
-                return {"region": region, "staging_counts": {}}
-            except Exception as e:
-                print(f"Unexpected error querying {region}: {e}")
-                return {"region": region, "staging_counts": {}}
+                        staging_counts[staging_account_id]["total"] += 1
 
-        # Query all 28 regions in parallel
-        regional_results = []
-        with ThreadPoolExecutor(max_workers=28) as executor:
-            futures = {executor.submit(query_region_for_staging, region): region for region in DRS_REGIONS}
+                        # Check if replicating
+                        replication_state = server.get("dataReplicationInfo", {}).get("dataReplicationState", "")
+                        if replication_state in [
+                            "CONTINUOUS",
+                            "INITIAL_SYNC",
+                            "RESCAN",
+                            "INITIATING",
+                            "CREATING_SNAPSHOT",
+                            "BACKLOG",
+                        ]:
+                            staging_counts[staging_account_id]["replicating"] += 1
 
-            for future in as_completed(futures):
-                try:
-                    result = future.result()
-                    regional_results.append(result)
-                except Exception as e:
-                    print(f"Error in staging region query: {e}")
-                    result = future.result()
-                    regional_results.append(result)
-                except Exception as e:
-                    print(f"Failed to get regional result: {e}")
+            return {"region": region, "staging_counts": staging_counts}
+
+        # Query all regions in parallel under the invocation deadline
+        regional_results = []
+        for cell in fan_out(query_region_for_staging, DRS_REGIONS):
+            if cell["status"] == STATUS_ACTIVE:
+                regional_results.append(cell["result"])
+                continue
+            if cell["status"] not in UNAVAILABLE_REGION_STATUSES:
+                print(f"Error querying {cell['region']}: {cell['status']} - {cell['errorMessage']}")
+            regional_results.append({"region": cell["region"], "staging_counts": {}})
 
         # Aggregate by staging account
         staging_totals = {}
@@ -5536,6 +5560,32 @@ def handle_discover_staging_accounts(query_params: Dict) -> Dict:
                 {"error": f"Invalid account ID format: {target_account_id}"},
             )
 
+        # Full-region scan of the target account; cache per target account
+        return _response_cache.get_or_compute(
+            f"{NAMESPACE_STAGING_ACCOUNTS}:{target_account_id}",
+            lambda: _query_discovered_staging_accounts(target_account_id),
+            ttl=CACHE_TTL_STAGING_DISCOVERY,
+            cacheable=_is_success_response,
+        )
+
+    except Exception as e:
+        print(f"Error in handle_discover_staging_accounts: {e}")
+        import traceback
+
+        traceback.print_exc()
+
+        return response(
+            500,
+            {
+                "error": "Internal error",
+                "message": str(e),
+            },
+        )
+
+
+def _query_discovered_staging_accounts(target_account_id: str) -> Dict:
+    """Cache-miss path of handle_discover_staging_accounts; returns the API response."""
+    try:
         print(f"Discovering staging accounts for target account {target_account_id}")
 
         # Step 2: Get target account configuration for credentials
@@ -5709,12 +5759,36 @@ def handle_get_combined_capacity(query_params: Dict) -> Dict:
                 {"error": f"Invalid account ID format: {target_account_id}. Must be 12-digit string."},
             )
 
-        # Check cache first (30-second TTL)
-        cache_key = f"combined_capacity_{target_account_id}"
-        cached_response = get_cached_response(cache_key, ttl=CACHE_TTL_CAPACITY)
-        if cached_response is not None:
-            return response(200, cached_response)
+        # Check cache first (30-second TTL); concurrent misses share one query
+        return _response_cache.get_or_compute(
+            f"{NAMESPACE_COMBINED_CAPACITY}:{target_account_id}",
+            lambda: _query_combined_capacity(target_account_id),
+            ttl=CACHE_TTL_CAPACITY,
+            cacheable=_is_success_response,
+        )
+
+    except Exception as e:
+        print(f"Error in handle_get_combined_capacity: {e}")
+        import traceback
+
+        traceback.print_exc()
+
+        return response(
+            500,
+            {
+                "error": "Internal error",
+                "message": str(e),
+            },
+        )
+
 
+def _query_combined_capacity(target_account_id: str) -> Dict:
+    """
+    Query combined capacity for a validated target account ID.
+
+    Cache-miss path of handle_get_combined_capacity; returns the API response.
+    """
+    try:
         print(f"Querying combined capacity for target account {target_account_id} (cache miss)")
 
         # Step 2: Retrieve target account configuration from DynamoDB
@@ -5941,14 +6015,12 @@ def handle_get_combined_capacity(query_params: Dict) -> Dict:
             if role_arn and external_id:
                 try:
                     print("Assuming role for jobs query...")
-                    sts_client = boto3.client("sts")
-                    assumed_role = sts_client.assume_role(
-                        RoleArn=role_arn,
-                        RoleSessionName="drs-orchestration-jobs-query",
-                        ExternalId=external_id,
-                        DurationSeconds=900,
+                    credentials = get_assumed_role_credentials(
+                        role_arn,
+                        external_id=external_id,
+                        session_name="drs-orchestration-jobs-query",
+                        client_factory=boto3.client,
                     )
-                    credentials = assumed_role["Credentials"]
                     print("Successfully assumed role for jobs query")
                 except Exception as e:
                     print(f"Warning: Could not assume role for jobs query: {e}")
@@ -6177,9 +6249,6 @@ def handle_get_combined_capacity(query_params: Dict) -> Dict:
             f"({response_data['combined']['percentUsed']}%)"
         )
 
-        # Cache the response for 30 seconds to improve performance
-        set_cached_response(cache_key, response_data)
-
         return response(200, response_data)
 
     except Exception as e:
@@ -6212,12 +6281,17 @@ def handle_get_all_accounts_capacity() -> Dict:
     Returns:
         Dict with aggregated capacity data for all target accounts
     """
-    # Check cache first (30-second TTL)
-    cache_key = "all_accounts_capacity"
-    cached_response = get_cached_response(cache_key, ttl=CACHE_TTL_CAPACITY)
-    if cached_response is not None:
-        return response(200, cached_response)
+    # Check cache first (30-second TTL); concurrent misses share one query
+    return _response_cache.get_or_compute(
+        NAMESPACE_ALL_ACCOUNTS_CAPACITY,
+        _query_all_accounts_capacity,
+        ttl=CACHE_TTL_CAPACITY,
+        cacheable=_is_success_response,
+    )
 
+
+def _query_all_accounts_capacity() -> Dict:
+    """Cache-miss path of handle_get_all_accounts_capacity; returns the API response."""
     try:
         print("Querying capacity for ALL target accounts (cache miss)")
 
@@ -6496,9 +6570,6 @@ def handle_get_all_accounts_capacity() -> Dict:
             f"({response_data['combined']['percentUsed']:.1f}%)"
         )
 
-        # Cache the response for 30 seconds to improve dashboard performance
-        set_cached_response(cache_key, response_data)
-
         return response(200, response_data)
 
     except Exception as e:
@@ -0,0 +1,224 @@
+# Copyright Amazon.com and Affiliates. All rights reserved.
+# This deliverable is considered Developed Content as defined in the AWS Service Terms.
+
+"""
+Pooled boto3 Client Registry
+
+Hands out cached, thread-safe boto3 clients keyed by
+``(account, region, service, profile)``. Clients live at module level so they
+survive warm Lambda invocations, and each one is built with a connection pool
+large enough for the 28-thread regional fan-outs.
+
+Cross-account clients are built from the shared STS credential cache
+(shared.credential_cache). When the cached credentials are refreshed the
+registry notices the new access key and transparently rebuilds the client,
+so callers never hold a client with expired credentials.
+
+Client Profiles:
+    - default: Standard timeouts and retries, pooled connections
+    - fast: Short timeouts, single attempt (regional discovery fan-outs)
+    - long_running: Extended read timeout for large DRS batch operations
+
+Key Functions:
+    - get_client(): Cached client for the current account or an explicit role ARN
+    - get_client_for_account(): Cached client from an account_context dict
+    - get_registry_stats(): Hit/miss/rebuild counters for diagnostics
+    - clear_registry(): Drop cached clients (used by tests)
+
+Usage:
+    from shared.client_registry import get_client, get_client_for_account
+
+    drs = get_client("drs", "us-east-1")
+    drs = get_client_for_account("drs", "us-west-2", account_context, profile="long_running")
+
+boto3 clients are thread-safe once created; creation itself is serialized
+per key so concurrent first calls from a thread pool build a single client.
+"""
+
+import logging
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+import boto3
+from botocore.config import Config
+
+from shared.credential_cache import get_assumed_role_credentials
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Sized above the widest fan-out (28 DRS regions) so threads never queue for a connection
+MAX_POOL_CONNECTIONS = 32
+
+CLIENT_PROFILES: Dict[str, Config] = {
+    "default": Config(max_pool_connections=MAX_POOL_CONNECTIONS),
+    "fast": Config(
+        connect_timeout=5,
+        read_timeout=10,
+        retries={"max_attempts": 1},
+        max_pool_connections=MAX_POOL_CONNECTIONS,
+    ),
+    "long_running": Config(
+        connect_timeout=10,
+        read_timeout=120,
+        retries={"max_attempts": 2},
+        max_pool_connections=MAX_POOL_CONNECTIONS,
+    ),
+}
+
+# Account key used for clients built from the Lambda execution role
+CURRENT_ACCOUNT = "current"
+
+# Cache structure: {(account, region, service, profile): {"client": client, "roleArn": str, "accessKeyId": str}}
+_client_cache: Dict[Tuple[str, str, str, str], Dict] = {}
+
+# Guards _client_cache and _build_locks
+_registry_lock = threading.Lock()
+
+# One lock per key so concurrent misses build a single client
+_build_locks: Dict[Tuple[str, str, str, str], threading.Lock] = {}
+
+_stats = {"hits": 0, "misses": 0, "rebuilds": 0}
+
+
+def _account_from_role_arn(role_arn: str) -> str:
+    """Extract the 12-digit account ID from an IAM role ARN."""
+    parts = role_arn.split(":")
+    return parts[4] if len(parts) > 4 and parts[4] else role_arn
+
+
+def get_client(
+    service: str,
+    region: Optional[str] = None,
+    role_arn: Optional[str] = None,
+    external_id: Optional[str] = None,
+    profile: str = "default",
+    client_factory: Optional[Callable] = None,
+):
+    """
+    Return a cached boto3 client, creating it on first use.
+
+    Args:
+        service: AWS service name (e.g. "drs", "ec2")
+        region: AWS region (None for global services such as IAM)
+        role_arn: Optional IAM role to assume; current credentials are used when omitted
+        external_id: Optional external ID for role assumption
+        profile: Name of a CLIENT_PROFILES entry controlling timeouts and retries
+        client_factory: Callable used to build clients (defaults to boto3.client).
+            Handlers pass their own module's ``boto3.client`` so patched clients are honoured.
+
+    Returns:
+        boto3 client for the requested account, region and service
+
+    Raises:
+        ValueError: If profile is unknown
+        ClientError/Exception: Propagated from sts:AssumeRole for cross-account clients
+    """
+    if profile not in CLIENT_PROFILES:
+        raise ValueError(f"Unknown client profile '{profile}'. Valid profiles: {sorted(CLIENT_PROFILES)}")
+
+    factory = client_factory or boto3.client
+    account = _account_from_role_arn(role_arn) if role_arn else CURRENT_ACCOUNT
+    key = (account, region or "", service, profile)
+
+    credentials = None
+    if role_arn:
+        credentials = get_assumed_role_credentials(role_arn, external_id=external_id, client_factory=factory)
+    access_key_id = credentials["AccessKeyId"] if credentials else None
+
+    with _registry_lock:
+        entry = _client_cache.get(key)
+        if entry and entry["roleArn"] == role_arn and entry["accessKeyId"] == access_key_id:
+            _stats["hits"] += 1
+            return entry["client"]
+        build_lock = _build_locks.setdefault(key, threading.Lock())
+
+    with build_lock:
+        with _registry_lock:
+            entry = _client_cache.get(key)
+            if entry and entry["roleArn"] == role_arn and entry["accessKeyId"] == access_key_id:
+                _stats["hits"] += 1
+                return entry["client"]
+            if entry:
+                _stats["rebuilds"] += 1
+            else:
+                _stats["misses"] += 1
+
+        client_kwargs = {"config": CLIENT_PROFILES[profile]}
+        if region:
+            client_kwargs["region_name"] = region
+        if credentials:
+            client_kwargs["aws_access_key_id"] = credentials["AccessKeyId"]
+            client_kwargs["aws_secret_access_key"] = credentials["SecretAccessKey"]
+            client_kwargs["aws_session_token"] = credentials["SessionToken"]
+
+        client = factory(service, **client_kwargs)
+
+        with _registry_lock:
+            _client_cache[key] = {"client": client, "roleArn": role_arn, "accessKeyId": access_key_id}
+
+        logger.debug(f"Created {service} client for {account}/{region} (profile={profile})")
+        return client
+
+
+def get_client_for_account(
+    service: str,
+    region: Optional[str] = None,
+    account_context: Optional[Dict] = None,
+    profile: str = "default",
+    client_factory: Optional[Callable] = None,
+):
+    """
+    Return a cached boto3 client for the account described by account_context.
+
+    Mirrors the account_context semantics of cross_account.create_drs_client:
+    no context (or isCurrentAccount=True) uses the current credentials, otherwise
+    the role ``arn:aws:iam::{accountId}:role/{assumeRoleName}`` is assumed.
+
+    Args:
+        service: AWS service name
+        region: AWS region
+        account_context: Optional dict with accountId, assumeRoleName, externalId, isCurrentAccount
+        profile: Name of a CLIENT_PROFILES entry
+        client_factory: Callable used to build clients (defaults to boto3.client)
+
+    Returns:
+        boto3 client for the target account
+
+    Raises:
+        ValueError: If cross-account context is missing accountId or assumeRoleName
+    """
+    if not account_context or account_context.get("isCurrentAccount", True):
+        return get_client(service, region, profile=profile, client_factory=client_factory)
+
+    account_id = account_context.get("accountId")
+    assume_role_name = account_context.get("assumeRoleName")
+
+    if not account_id:
+        raise ValueError("Cross-account operation requires AccountId in account_context")
+    if not assume_role_name:
+        raise ValueError(f"Cross-account operation requires AssumeRoleName for account {account_id}")
+
+    return get_client(
+        service,
+        region,
+        role_arn=f"arn:aws:iam::{account_id}:role/{assume_role_name}",
+        external_id=account_context.get("externalId"),
+        profile=profile,
+        client_factory=client_factory,
+    )
+
+
+def get_registry_stats() -> Dict[str, int]:
+    """Return hit/miss/rebuild counters and the number of cached clients."""
+    with _registry_lock:
+        return {**_stats, "size": len(_client_cache)}
+
+
+def clear_registry() -> None:
+    """Drop all cached clients and reset counters."""
+    with _registry_lock:
+        _client_cache.clear()
+        _build_locks.clear()
+        for name in _stats:
+            _stats[name] = 0
@@ -45,6 +45,7 @@ from botocore.exceptions import ClientError
 
 # Import cross-account utilities
 from shared.cross_account import create_drs_client
+from shared.tag_index import get_index_account_id, get_tag_index_table, resolve_servers_by_tags
 
 # Initialize AWS clients
 dynamodb = boto3.resource("dynamodb")
@@ -221,6 +222,10 @@ def query_drs_servers_by_tags(region: str, tags: Dict[str, str], account_context
     Query DRS source servers that have ALL specified tags.
     Uses AND logic - DRS source server must have all tags to be included.
 
+    When the inverted tag index (shared.tag_index) is current for the region,
+    matches are returned as {"sourceServerID": id} items without listing
+    the region from DRS.
+
     Args:
         region: AWS region to query
         tags: Dictionary of tag key-value pairs to match
@@ -230,6 +235,11 @@ def query_drs_servers_by_tags(region: str, tags: Dict[str, str], account_context
         List of matching DRS source servers
     """
     try:
+        if get_tag_index_table() is not None:
+            indexed = resolve_servers_by_tags(get_index_account_id(account_context), region, tags)
+            if indexed is not None:
+                return [{"sourceServerID": server_id} for server_id in indexed]
+
         regional_drs = create_drs_client(region, account_context)
 
         # Get all source servers in the region
@@ -0,0 +1,231 @@
+# Copyright Amazon.com and Affiliates. All rights reserved.
+# This deliverable is considered Developed Content as defined in the AWS Service Terms.
+
+"""
+STS Credential Cache for Cross-Account Role Assumption
+
+Process-wide cache of temporary credentials returned by ``sts:AssumeRole``,
+keyed by ``(role ARN, external ID)``. Credentials live at module level so
+they survive warm Lambda invocations, and are refreshed shortly before they
+expire so callers never receive credentials that are about to lapse.
+
+Concurrent callers (e.g. the 28-thread regional fan-outs) that miss the cache
+for the same key are collapsed into a single STS call: the first thread
+refreshes while the others wait on a per-key lock and then read the result.
+
+Key Functions:
+    - get_assumed_role_credentials(): Raw STS credential dict (cached)
+    - get_assumed_role_session(): boto3.Session built from cached credentials
+    - get_client_kwargs(): Credential kwargs for boto3.client(...)
+    - invalidate_credentials(): Drop cached credentials (e.g. after AccessDenied)
+    - get_cache_stats(): Hit/miss/refresh counters for diagnostics
+
+Usage:
+    from shared.credential_cache import get_client_kwargs
+
+    drs = boto3.client("drs", region_name=region, **get_client_kwargs(role_arn, external_id))
+
+Credentials without a parseable ``Expiration`` are returned but never cached,
+so callers always fall back to a fresh STS call in that case.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Optional, Tuple
+
+import boto3
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Refresh credentials this many seconds before STS expiration
+REFRESH_MARGIN_SECONDS = 300
+
+# Session duration requested from STS (matches the STS default of 1 hour)
+DEFAULT_DURATION_SECONDS = 3600
+
+# Cache structure: {(role_arn, external_id): {"credentials": dict, "expiresAt": unix_time}}
+_credential_cache: Dict[Tuple[str, str], Dict] = {}
+
+# Guards _credential_cache and _refresh_locks
+_cache_lock = threading.Lock()
+
+# One lock per cache key so concurrent refreshes collapse into a single STS call
+_refresh_locks: Dict[Tuple[str, str], threading.Lock] = {}
+
+_stats = {"hits": 0, "misses": 0, "refreshes": 0, "errors": 0}
+
+
+def _cache_key(role_arn: str, external_id: Optional[str]) -> Tuple[str, str]:
+    """Build the cache key for a role ARN / external ID pair."""
+    return (role_arn, external_id or "")
+
+
+def _parse_expiration(expiration) -> Optional[float]:
+    """
+    Convert an STS Expiration value to a unix timestamp.
+
+    boto3 returns a timezone-aware datetime; mocked responses frequently
+    use ISO 8601 strings. Anything else is treated as unknown.
+    """
+    if isinstance(expiration, datetime):
+        return expiration.timestamp()
+    if isinstance(expiration, str) and expiration:
+        try:
+            return datetime.fromisoformat(expiration.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            return None
+    return None
+
+
+def _get_valid_entry(key: Tuple[str, str]) -> Optional[Dict]:
+    """Return cached credentials for key if outside the refresh margin."""
+    entry = _credential_cache.get(key)
+    if entry and entry["expiresAt"] - REFRESH_MARGIN_SECONDS > time.time():
+        return entry["credentials"]
+    return None
+
+
+def get_assumed_role_credentials(
+    role_arn: str,
+    external_id: Optional[str] = None,
+    session_name: Optional[str] = None,
+    client_factory: Optional[Callable] = None,
+) -> Dict:
+    """
+    Return temporary credentials for role_arn, assuming the role only when needed.
+
+    Args:
+        role_arn: Full ARN of the IAM role to assume
+        external_id: Optional external ID for role assumption
+        session_name: RoleSessionName used if a fresh STS call is required
+        client_factory: Callable used to build the STS client (defaults to boto3.client).
+            Handlers pass their own module's ``boto3.client`` so patched clients are honoured.
+
+    Returns:
+        STS Credentials dict (AccessKeyId, SecretAccessKey, SessionToken, Expiration)
+
+    Raises:
+        ClientError/Exception: Propagated from sts:AssumeRole (failures are not cached)
+    """
+    key = _cache_key(role_arn, external_id)
+
+    with _cache_lock:
+        credentials = _get_valid_entry(key)
+        if credentials:
+            _stats["hits"] += 1
+            return credentials
+        refresh_lock = _refresh_locks.setdefault(key, threading.Lock())
+
+    with refresh_lock:
+        # Another thread may have refreshed while we waited for the lock
+        with _cache_lock:
+            credentials = _get_valid_entry(key)
+            if credentials:
+                _stats["hits"] += 1
+                return credentials
+            _stats["misses"] += 1
+
+        assume_role_params = {
+            "RoleArn": role_arn,
+            "RoleSessionName": session_name or f"drs-orchestration-{int(time.time())}",
+            "DurationSeconds": DEFAULT_DURATION_SECONDS,
+        }
+        if external_id:
+            assume_role_params["ExternalId"] = external_id
+
+        try:
+            sts_client = (client_factory or boto3.client)("sts")
+            credentials = sts_client.assume_role(**assume_role_params)["Credentials"]
+        except Exception:
+            with _cache_lock:
+                _stats["errors"] += 1
+            raise
+
+        expires_at = _parse_expiration(credentials.get("Expiration"))
+        with _cache_lock:
+            _stats["refreshes"] += 1
+            if expires_at is not None:
+                _credential_cache[key] = {"credentials": credentials, "expiresAt": expires_at}
+            else:
+                _credential_cache.pop(key, None)
+
+        logger.info(f"Assumed role {role_arn} (credential cache refresh)")
+        return credentials
+
+
+def get_client_kwargs(
+    role_arn: str,
+    external_id: Optional[str] = None,
+    session_name: Optional[str] = None,
+    client_factory: Optional[Callable] = None,
+) -> Dict[str, str]:
+    """
+    Return boto3.client() keyword arguments for cached role credentials.
+
+    Args:
+        role_arn: Full ARN of the IAM role to assume
+        external_id: Optional external ID for role assumption
+        session_name: RoleSessionName used if a fresh STS call is required
+        client_factory: Callable used to build the STS client (defaults to boto3.client)
+
+    Returns:
+        Dict with aws_access_key_id, aws_secret_access_key, aws_session_token
+    """
+    credentials = get_assumed_role_credentials(role_arn, external_id, session_name, client_factory)
+    return {
+        "aws_access_key_id": credentials["AccessKeyId"],
+        "aws_secret_access_key": credentials["SecretAccessKey"],
+        "aws_session_token": credentials["SessionToken"],
+    }
+
+
+def get_assumed_role_session(
+    role_arn: str,
+    external_id: Optional[str] = None,
+    session_name: Optional[str] = None,
+) -> boto3.Session:
+    """
+    Return a boto3.Session backed by cached role credentials.
+
+    Args:
+        role_arn: Full ARN of the IAM role to assume
+        external_id: Optional external ID for role assumption
+        session_name: RoleSessionName used if a fresh STS call is required
+
+    Returns:
+        boto3.Session configured with temporary credentials
+    """
+    return boto3.Session(**get_client_kwargs(role_arn, external_id, session_name))
+
+
+def invalidate_credentials(role_arn: Optional[str] = None, external_id: Optional[str] = None) -> None:
+    """
+    Drop cached credentials.
+
+    Args:
+        role_arn: Role to invalidate; clears the whole cache when omitted
+        external_id: External ID paired with role_arn
+    """
+    with _cache_lock:
+        if role_arn is None:
+            _credential_cache.clear()
+        else:
+            _credential_cache.pop(_cache_key(role_arn, external_id), None)
+
+
+def get_cache_stats() -> Dict[str, int]:
+    """Return hit/miss/refresh/error counters and current cache size."""
+    with _cache_lock:
+        return {**_stats, "size": len(_credential_cache)}
+
+
+def reset_cache() -> None:
+    """Clear cached credentials and counters (used by tests)."""
+    with _cache_lock:
+        _credential_cache.clear()
+        _refresh_locks.clear()
+        for name in _stats:
+            _stats[name] = 0
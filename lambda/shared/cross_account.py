@@ -152,6 +152,8 @@ from typing import Dict, Optional
 
 import boto3
 
+from shared.credential_cache import get_assumed_role_credentials
+
 # Lazy initialization to avoid boto3 errors during test collection
 _dynamodb = None
 _protection_groups_table = None
@@ -223,6 +225,10 @@ def get_cross_account_session(role_arn: str, external_id: str = None) -> boto3.S
     """
     Create a boto3 Session by assuming a cross-account IAM role.
 
+    Temporary credentials come from the process-wide credential cache
+    (shared.credential_cache), so repeated calls for the same role and
+    external ID reuse credentials until shortly before they expire.
+
     Args:
         role_arn: Full ARN of the IAM role to assume
         external_id: Optional external ID for role assumption
@@ -233,25 +239,17 @@ def get_cross_account_session(role_arn: str, external_id: str = None) -> boto3.S
     Raises:
         Exception: If role assumption fails
     """
-    import time
-
-    sts_client = boto3.client("sts")
-    session_name = f"drs-orchestration-{int(time.time())}"
-
     print(f"Assuming role: {role_arn}")
 
-    assume_role_params = {
-        "RoleArn": role_arn,
-        "RoleSessionName": session_name,
-    }
-
     if external_id:
-        assume_role_params["ExternalId"] = external_id
         print("Using External ID for role assumption")
 
     try:
-        assumed_role = sts_client.assume_role(**assume_role_params)
-        credentials = assumed_role["Credentials"]
+        credentials = get_assumed_role_credentials(
+            role_arn,
+            external_id=external_id,
+            client_factory=boto3.client,
+        )
 
         return boto3.Session(
             aws_access_key_id=credentials["AccessKeyId"],
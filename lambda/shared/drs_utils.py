@@ -538,6 +538,7 @@ def drs_api_call_with_backoff(
     operation: str,
     max_retries: int = 3,
     base_delay: float = 1.0,
+    rate_limiter=None,
     **kwargs,
 ):
     """
@@ -546,11 +547,17 @@ def drs_api_call_with_backoff(
     Handles TooManyRequestsException and ThrottlingException with exponential backoff
     to avoid overwhelming the DRS API and causing Lambda timeouts.
 
+    When a rate_limiter (shared.rate_limiter.AdaptiveRateLimiter) is supplied, every
+    attempt first acquires a token and throttling is reported back to the limiter,
+    which paces the retry instead of the fixed exponential sleep. Pass the shared
+    limiter from get_rate_limiter() so all threads hitting the same region coordinate.
+
     Args:
         client: boto3 DRS client
         operation: API operation name ('describe_source_servers', 'describe_jobs', etc.)
         max_retries: Maximum number of retry attempts (default: 3)
         base_delay: Base delay in seconds for exponential backoff (default: 1.0)
+        rate_limiter: Optional AdaptiveRateLimiter shared across callers
         **kwargs: Additional arguments to pass to the API call
 
     Returns:
@@ -569,23 +576,29 @@ def drs_api_call_with_backoff(
 
     for attempt in range(max_retries):
         try:
+            if rate_limiter:
+                rate_limiter.acquire()
+
             if operation == "describe_source_servers":
                 # Handle paginated operation
                 paginator = client.get_paginator("describe_source_servers")
-                results = []
+                result = []
                 for page in paginator.paginate(**kwargs):
-                    results.extend(page.get("items", []))
-                return results
+                    result.extend(page.get("items", []))
             elif operation == "describe_jobs":
-                return client.describe_jobs(**kwargs)
+                result = client.describe_jobs(**kwargs)
             elif operation == "describe_recovery_instances":
-                return client.describe_recovery_instances(**kwargs)
+                result = client.describe_recovery_instances(**kwargs)
             elif operation == "describe_job_log_items":
-                return client.describe_job_log_items(**kwargs)
+                result = client.describe_job_log_items(**kwargs)
             else:
                 # Generic operation - call method by name
                 method = getattr(client, operation)
-                return method(**kwargs)
+                result = method(**kwargs)
+
+            if rate_limiter:
+                rate_limiter.record_success()
+            return result
 
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "")
@@ -593,7 +606,16 @@ def drs_api_call_with_backoff(
                 "ThrottlingException",
                 "TooManyRequestsException",
             ]:
+                if rate_limiter:
+                    rate_limiter.record_throttle()
                 if attempt < max_retries - 1:
+                    if rate_limiter:
+                        # Next acquire() waits at the reduced rate
+                        print(
+                            f"Rate limited on {operation}, retrying at {rate_limiter.rate:.2f} req/s "
+                            f"(attempt {attempt + 1}/{max_retries})"
+                        )
+                        continue
                     delay = base_delay * (2**attempt)
                     print(
                         f"Rate limited on {operation}, retrying in {delay}s " f"(attempt {attempt + 1}/{max_retries})"
@@ -34,6 +34,8 @@ from typing import Dict, List, Optional
 import boto3
 from botocore.exceptions import ClientError
 
+from shared.rate_limiter import AdaptiveRateLimiter, get_rate_limiter, is_throttling_error
+
 # Configure logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -89,6 +91,7 @@ def apply_launch_configs_to_group(
     account_context: Optional[Dict] = None,
     timeout_seconds: int = 300,
     progress_callback: Optional[callable] = None,
+    rate_limiter: Optional[AdaptiveRateLimiter] = None,
 ) -> Dict:
     """
     Apply launch configurations to all servers in a protection group.
@@ -97,6 +100,11 @@ def apply_launch_configs_to_group(
     retry logic, and per-server error tracking. Supports partial success
     where some servers succeed and others fail.
 
+    Calls are paced by an adaptive rate limiter shared by every thread that
+    updates launch configurations in the same account and region. Throttling
+    lowers the shared rate and the retry waits for the next token, instead of
+    sleeping on a fixed schedule.
+
     Args:
         group_id: Protection group ID
         region: AWS region
@@ -109,6 +117,8 @@ def apply_launch_configs_to_group(
             - completed: Number of servers processed
             - total: Total number of servers
             - percentage: Completion percentage (0-100)
+        rate_limiter: Optional AdaptiveRateLimiter; defaults to the shared
+            DRS write limiter for the target account and region
 
     Returns:
         Dictionary containing application status with keys:
@@ -188,6 +198,12 @@ def apply_launch_configs_to_group(
         logger.error(error_msg)
         raise LaunchConfigApplicationError(error_msg)
 
+    if rate_limiter is None:
+        target_account_id = None
+        if account_context and not account_context.get("isCurrentAccount", True):
+            target_account_id = account_context.get("accountId")
+        rate_limiter = get_rate_limiter("drs", region, target_account_id, "update_launch_configuration")
+
     # Apply configuration to each server
     for idx, server_id in enumerate(server_ids):
         # Check timeout
@@ -222,12 +238,12 @@ def apply_launch_configs_to_group(
             completed_servers += 1
             continue
 
-        # Apply configuration with exponential backoff retry logic
+        # Apply configuration with rate-limited retries on throttling
         max_retries = 3
-        retry_delays = [1, 2, 4]  # Exponential backoff: 1s, 2s, 4s
 
         for attempt in range(max_retries):
             try:
+                rate_limiter.acquire()
                 _apply_config_to_server(
                     drs_client,
                     server_id,
@@ -235,6 +251,7 @@ def apply_launch_configs_to_group(
                     region,
                     account_context=account_context,
                 )
+                rate_limiter.record_success()
 
                 # Calculate config hash for drift detection
                 config_hash = calculate_config_hash(launch_config)
@@ -255,16 +272,16 @@ def apply_launch_configs_to_group(
                 # Handle boto3 ClientError with proper error code checking
                 error_code = e.response.get("Error", {}).get("Code", "")
                 error_msg = e.response.get("Error", {}).get("Message", str(e))
-                is_throttling = error_code in ["ThrottlingException", "TooManyRequestsException"]
+                is_throttling = is_throttling_error(e)
+                if is_throttling:
+                    rate_limiter.record_throttle()
 
-                # Retry on throttling errors
+                # Retry on throttling errors (next acquire waits at the reduced rate)
                 if is_throttling and attempt < max_retries - 1:
-                    delay = retry_delays[attempt]
                     logger.warning(
-                        f"AWS API throttled for server {server_id}, "
-                        f"retrying in {delay}s (attempt {attempt + 1}/{max_retries})"
+                        f"AWS API throttled for server {server_id}, retrying at "
+                        f"{rate_limiter.rate:.2f} req/s (attempt {attempt + 1}/{max_retries})"
                     )
-                    time.sleep(delay)
                     continue
                 else:
                     # Final failure - no more retries
@@ -288,15 +305,15 @@ def apply_launch_configs_to_group(
                 # Handle other exceptions (LaunchConfigApplicationError, etc.)
                 error_msg = str(e)
                 is_throttling = "throttl" in error_msg.lower()
+                if is_throttling:
+                    rate_limiter.record_throttle()
 
-                # Retry on throttling errors
+                # Retry on throttling errors (next acquire waits at the reduced rate)
                 if is_throttling and attempt < max_retries - 1:
-                    delay = retry_delays[attempt]
                     logger.warning(
-                        f"AWS API throttled for server {server_id}, "
-                        f"retrying in {delay}s (attempt {attempt + 1}/{max_retries})"
+                        f"AWS API throttled for server {server_id}, retrying at "
+                        f"{rate_limiter.rate:.2f} req/s (attempt {attempt + 1}/{max_retries})"
                     )
-                    time.sleep(delay)
                     continue
                 else:
                     # Final failure - no more retries
@@ -583,6 +600,7 @@ def _get_cross_account_drs_client(region: str, account_context: Dict):
         account_context: Dict with keys:
             - accountId: Target account ID
             - assumeRoleName: Role name to assume
+            - externalId: Optional external ID for role assumption
 
     Returns:
         boto3 DRS client with assumed role credentials
@@ -591,23 +609,20 @@ def _get_cross_account_drs_client(region: str, account_context: Dict):
         LaunchConfigApplicationError: When role assumption fails
     """
     try:
-        sts_client = boto3.client("sts")
+        from shared.credential_cache import get_client_kwargs
 
-        # Assume role in target account
+        # Assume role in target account (credentials cached across invocations)
         role_arn = f"arn:aws:iam::{account_context['accountId']}:" f"role/{account_context['assumeRoleName']}"
 
-        response = sts_client.assume_role(RoleArn=role_arn, RoleSessionName="launch-config-application")
-
-        credentials = response["Credentials"]
+        credential_kwargs = get_client_kwargs(
+            role_arn,
+            external_id=account_context.get("externalId"),
+            session_name="launch-config-application",
+            client_factory=boto3.client,
+        )
 
         # Create DRS client with assumed role credentials
-        drs_client = boto3.client(
-            "drs",
-            region_name=region,
-            aws_access_key_id=credentials["AccessKeyId"],
-            aws_secret_access_key=credentials["SecretAccessKey"],
-            aws_session_token=credentials["SessionToken"],
-        )
+        drs_client = boto3.client("drs", region_name=region, **credential_kwargs)
 
         return drs_client
 
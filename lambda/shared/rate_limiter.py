@@ -0,0 +1,278 @@
+# Copyright Amazon.com and Affiliates. All rights reserved.
+# This deliverable is considered Developed Content as defined in the AWS Service Terms.
+
+"""
+Adaptive Token-Bucket Rate Limiter for DRS and EC2 APIs
+
+Coordinates API call rates across all threads in a Lambda container that
+target the same (account, region, service, operation class). Each bucket
+starts at its configured TPS budget and adapts from throttling feedback
+using AIMD (additive increase, multiplicative decrease):
+
+    - Every successful call nudges the rate up by a small step (capped at the budget)
+    - Every ThrottlingException halves the rate (floored at a minimum) and drains
+      the burst allowance so in-flight threads stop piling on
+
+Large fan-outs therefore run at the highest rate the service will sustain
+instead of bursting, getting throttled and sleeping on fixed backoffs.
+
+Rate Budgets:
+    DRS and EC2 throttle per account and per region. Operations are grouped
+    into classes (read, write, recovery) with a refill rate and burst size per
+    class; see RATE_BUDGETS. EC2 values follow the EC2 API request-token bucket
+    model (non-mutating vs mutating actions). DRS publishes a single per-account
+    request quota rather than per-action limits, so DRS values sit below the
+    observed throttling threshold and StartRecovery is kept deliberately low.
+
+Key Functions:
+    - get_rate_limiter(): Shared limiter for an account/region/service/operation
+    - AdaptiveRateLimiter.acquire(): Reserve a token, sleeping until it is available
+    - AdaptiveRateLimiter.call(): acquire + call + feed throttling back into the bucket
+    - is_throttling_error(): Detect ThrottlingException/TooManyRequestsException
+    - get_rate_limiter_stats(): Current rates and counters for diagnostics
+
+Usage:
+    from shared.rate_limiter import get_rate_limiter
+
+    limiter = get_rate_limiter("drs", region, account_id, "update_launch_configuration")
+    limiter.call(drs_client.update_launch_configuration, sourceServerID=server_id)
+
+Callers that accept a ``rate_limiter`` argument fall back to the shared
+limiter when none is injected, so tests and callers with their own pacing
+can pass a dedicated instance.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from botocore.exceptions import ClientError
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+THROTTLING_ERROR_CODES = frozenset(
+    [
+        "ThrottlingException",
+        "TooManyRequestsException",
+        "RequestLimitExceeded",
+        "Throttling",
+    ]
+)
+
+# Per account, per region budgets: {service: {operation_class: (refill_rate_per_second, burst)}}
+RATE_BUDGETS: Dict[str, Dict[str, Tuple[float, int]]] = {
+    "drs": {
+        "read": (10.0, 20),
+        "write": (5.0, 10),
+        "recovery": (1.0, 2),
+    },
+    "ec2": {
+        "read": (20.0, 100),
+        "write": (5.0, 50),
+    },
+}
+
+# DRS actions that launch or terminate recovery instances
+_RECOVERY_OPERATIONS = frozenset(
+    [
+        "start_recovery",
+        "terminate_recovery_instances",
+        "start_failback_launch",
+        "reverse_replication",
+    ]
+)
+
+_READ_PREFIXES = ("describe_", "get_", "list_")
+
+# Never adapt below this fraction of the budget
+MIN_RATE_FRACTION = 0.1
+
+# Multiplicative decrease applied on throttling
+DECREASE_FACTOR = 0.5
+
+# Additive increase per success, as a fraction of the budget
+INCREASE_FRACTION = 0.05
+
+
+class AdaptiveRateLimiter:
+    """
+    Thread-safe token bucket whose refill rate adapts to throttling (AIMD).
+
+    Tokens are reserved rather than polled: ``acquire`` deducts a token
+    immediately (the balance may go negative) and sleeps once for the time
+    the reservation needs to become valid. Concurrent callers therefore queue
+    in arrival order without spinning.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        min_rate: Optional[float] = None,
+        increase: Optional[float] = None,
+        decrease_factor: float = DECREASE_FACTOR,
+        name: str = "",
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.name = name
+        self.max_rate = float(rate)
+        self.min_rate = min_rate if min_rate is not None else max(self.max_rate * MIN_RATE_FRACTION, 0.1)
+        self.increase = increase if increase is not None else self.max_rate * INCREASE_FRACTION
+        self.decrease_factor = decrease_factor
+        self.burst = burst
+
+        self._rate = self.max_rate
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._stats = {"acquired": 0, "throttled": 0, "waitSeconds": 0.0}
+
+    @property
+    def rate(self) -> float:
+        """Current refill rate in requests per second."""
+        return self._rate
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        if elapsed > 0:
+            self._tokens = min(float(self.burst), self._tokens + elapsed * self._rate)
+            self._updated_at = now
+
+    def acquire(self) -> float:
+        """
+        Reserve one token, sleeping until it is available.
+
+        Returns:
+            Seconds spent waiting (0.0 when a token was immediately available)
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+            self._stats["acquired"] += 1
+            self._stats["waitSeconds"] += wait
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def record_success(self) -> None:
+        """Additive increase: raise the rate by one step, up to the budget."""
+        with self._lock:
+            self._rate = min(self.max_rate, self._rate + self.increase)
+
+    def record_throttle(self) -> None:
+        """Multiplicative decrease: cut the rate and drop any burst allowance."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._rate = max(self.min_rate, self._rate * self.decrease_factor)
+            self._tokens = min(self._tokens, 0.0)
+            self._stats["throttled"] += 1
+        logger.warning(f"Rate limiter {self.name} throttled, rate reduced to {self._rate:.2f} req/s")
+
+    def call(self, func: Callable, *args, **kwargs):
+        """
+        Call func once under the limiter and report the outcome.
+
+        Throttling errors are recorded and re-raised so the caller's retry
+        policy still applies; the next ``acquire`` is paced at the reduced rate.
+        """
+        self.acquire()
+        try:
+            result = func(*args, **kwargs)
+        except ClientError as e:
+            if is_throttling_error(e):
+                self.record_throttle()
+            raise
+        self.record_success()
+        return result
+
+    def get_stats(self) -> Dict:
+        """Return current rate, budget and counters."""
+        with self._lock:
+            return {
+                "rate": round(self._rate, 3),
+                "maxRate": self.max_rate,
+                "burst": self.burst,
+                **self._stats,
+            }
+
+
+# Shared limiters: {(account, region, service, operation_class): AdaptiveRateLimiter}
+_limiters: Dict[Tuple[str, str, str, str], AdaptiveRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def is_throttling_error(error: Exception) -> bool:
+    """Return True if error is an AWS throttling ClientError."""
+    if not isinstance(error, ClientError):
+        return False
+    return error.response.get("Error", {}).get("Code", "") in THROTTLING_ERROR_CODES
+
+
+def get_operation_class(service: str, operation: Optional[str]) -> str:
+    """
+    Map an API operation (boto3 method name) to its rate budget class.
+
+    Args:
+        service: AWS service name ("drs" or "ec2")
+        operation: boto3 method name, e.g. "describe_jobs"; None is treated as a read
+
+    Returns:
+        Operation class key in RATE_BUDGETS[service]
+    """
+    if not operation or operation.startswith(_READ_PREFIXES):
+        return "read"
+    if service == "drs" and operation in _RECOVERY_OPERATIONS:
+        return "recovery"
+    return "write"
+
+
+def get_rate_limiter(
+    service: str,
+    region: Optional[str],
+    account_id: Optional[str] = None,
+    operation: Optional[str] = None,
+) -> AdaptiveRateLimiter:
+    """
+    Return the shared limiter for an account/region/service/operation class.
+
+    Args:
+        service: AWS service name ("drs" or "ec2"); other services use the EC2 budgets
+        region: AWS region
+        account_id: Target account ID (None for the Lambda's own account)
+        operation: boto3 method name used to pick the budget class
+
+    Returns:
+        AdaptiveRateLimiter shared by all threads in this container
+    """
+    operation_class = get_operation_class(service, operation)
+    key = (account_id or "current", region or "", service, operation_class)
+
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            budgets = RATE_BUDGETS.get(service, RATE_BUDGETS["ec2"])
+            rate, burst = budgets.get(operation_class, budgets["write"])
+            limiter = AdaptiveRateLimiter(rate, burst, name="/".join(key))
+            _limiters[key] = limiter
+        return limiter
+
+
+def get_rate_limiter_stats() -> Dict[str, Dict]:
+    """Return stats for every shared limiter, keyed by account/region/service/class."""
+    with _limiters_lock:
+        limiters = dict(_limiters)
+    return {"/".join(key): limiter.get_stats() for key, limiter in limiters.items()}
+
+
+def reset_rate_limiters() -> None:
+    """Drop all shared limiters (used by tests)."""
+    with _limiters_lock:
+        _limiters.clear()
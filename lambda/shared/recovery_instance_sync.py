@@ -36,6 +36,8 @@ from typing import Any, Dict, List, Optional
 import boto3
 from botocore.exceptions import ClientError
 
+from shared.client_registry import get_client
+
 # Configure logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -417,7 +419,7 @@ def enrich_with_ec2_details(
         if account_context and not account_context.get("isCurrentAccount", True):
             ec2_client = _get_cross_account_ec2_client(region, account_context)
         else:
-            ec2_client = boto3.client("ec2", region_name=region)
+            ec2_client = get_client("ec2", region, client_factory=boto3.client)
     except Exception as e:
         logger.warning(f"Failed to create EC2 client for {account_id}/{region}: {e}")
         return {"Name": f"Recovery instance {ec2_instance_id}", "InstanceType": "unknown"}
@@ -0,0 +1,254 @@
+# Copyright Amazon.com and Affiliates. All rights reserved.
+# This deliverable is considered Developed Content as defined in the AWS Service Terms.
+
+"""
+Multi-Region Fan-Out Engine
+
+Runs a per-region (or per account and region) function across the DRS region
+list on a bounded thread pool and returns one result cell per input. All
+fan-outs in an invocation share a single deadline derived from the Lambda
+context, so a slow region cannot push the handler past its timeout: cells
+that have not finished when the budget runs out are reported as TIMEOUT and
+the completed cells are returned as partial results.
+
+Errors are classified with the status vocabulary used by the region status
+table (DRSRegionStatusTable), so callers and the inventory sync record the
+same statuses.
+
+Region Statuses:
+    - ACTIVE: Call succeeded
+    - NOT_INITIALIZED: DRS not initialized in the region
+    - IAM_PERMISSION_DENIED: AccessDeniedException from IAM
+    - SCP_DENIED: Blocked by a Service Control Policy
+    - THROTTLED: API rate limit exceeded
+    - REGION_NOT_OPTED_IN: Opt-in region not enabled (OptInRequired)
+    - REGION_NOT_ENABLED: Region not enabled for the account's credentials
+    - ENDPOINT_UNREACHABLE: Could not connect to the regional endpoint
+    - TIMEOUT: Invocation deadline reached before the call completed
+    - ERROR: Any other failure
+
+Key Functions:
+    - set_invocation_deadline(): Record the deadline from the Lambda context
+    - get_remaining_seconds(): Seconds left before the shared deadline
+    - fan_out(): Run a function over regions or an account x region matrix
+    - classify_region_error(): Map an exception to (status, errorMessage)
+
+Usage:
+    from shared.region_fanout import fan_out
+
+    def count_servers(region):
+        return _count_drs_servers(create_drs_client(region), account_id)
+
+    for cell in fan_out(count_servers, DRS_REGIONS):
+        if cell["status"] == "ACTIVE":
+            total += cell["result"]["totalServers"]
+
+boto3 clients block, so the engine uses threads rather than an event loop.
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from botocore.exceptions import ClientError
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+STATUS_ACTIVE = "ACTIVE"
+STATUS_NOT_INITIALIZED = "NOT_INITIALIZED"
+STATUS_IAM_PERMISSION_DENIED = "IAM_PERMISSION_DENIED"
+STATUS_SCP_DENIED = "SCP_DENIED"
+STATUS_THROTTLED = "THROTTLED"
+STATUS_REGION_NOT_OPTED_IN = "REGION_NOT_OPTED_IN"
+STATUS_REGION_NOT_ENABLED = "REGION_NOT_ENABLED"
+STATUS_ENDPOINT_UNREACHABLE = "ENDPOINT_UNREACHABLE"
+STATUS_TIMEOUT = "TIMEOUT"
+STATUS_ERROR = "ERROR"
+
+# Statuses that mean "DRS is not usable here" rather than "the query failed";
+# capacity views count these regions as zero servers
+UNAVAILABLE_REGION_STATUSES = frozenset(
+    [
+        STATUS_NOT_INITIALIZED,
+        STATUS_REGION_NOT_OPTED_IN,
+        STATUS_REGION_NOT_ENABLED,
+    ]
+)
+
+# Sized to the 28 DRS regions (client pools allow 32 connections)
+DEFAULT_MAX_WORKERS = 28
+
+# Time kept back from the Lambda timeout for aggregation and the response
+DEADLINE_SAFETY_MARGIN_SECONDS = 5.0
+
+# Budget used when no Lambda context was recorded (tests, local scripts)
+DEFAULT_BUDGET_SECONDS = 60.0
+
+# Absolute time.monotonic() deadline for the current invocation
+_invocation_deadline: Optional[float] = None
+
+
+def set_invocation_deadline(context, safety_margin: float = DEADLINE_SAFETY_MARGIN_SECONDS) -> Optional[float]:
+    """
+    Record the shared fan-out deadline from the Lambda context.
+
+    Call once at the start of lambda_handler. Contexts without
+    get_remaining_time_in_millis (tests, direct calls) clear the deadline
+    so the default budget applies.
+
+    Args:
+        context: Lambda context object
+        safety_margin: Seconds reserved before the Lambda timeout
+
+    Returns:
+        Recorded monotonic deadline, or None
+    """
+    global _invocation_deadline
+
+    get_remaining = getattr(context, "get_remaining_time_in_millis", None)
+    remaining_ms = get_remaining() if callable(get_remaining) else None
+    if not isinstance(remaining_ms, (int, float)):
+        _invocation_deadline = None
+        return None
+
+    _invocation_deadline = time.monotonic() + max(0.0, remaining_ms / 1000.0 - safety_margin)
+    return _invocation_deadline
+
+
+def get_remaining_seconds(deadline: Optional[float] = None) -> float:
+    """
+    Seconds left before the deadline (never negative).
+
+    Args:
+        deadline: Explicit monotonic deadline; defaults to the invocation deadline
+    """
+    if deadline is None:
+        deadline = _invocation_deadline
+    if deadline is None:
+        return DEFAULT_BUDGET_SECONDS
+    return max(0.0, deadline - time.monotonic())
+
+
+def classify_region_error(error: Exception) -> Tuple[str, str]:
+    """
+    Map a regional API failure to a region status and error message.
+
+    Args:
+        error: Exception raised by the regional call
+
+    Returns:
+        Tuple of (status, errorMessage)
+    """
+    msg = str(error)
+
+    if isinstance(error, ClientError):
+        code = error.response.get("Error", {}).get("Code", "")
+        error_msg = error.response.get("Error", {}).get("Message", msg)
+
+        if code == "UninitializedAccountException" or "not initialized" in msg.lower():
+            return STATUS_NOT_INITIALIZED, "DRS not initialized in region"
+        if code == "AccessDeniedException" or "AccessDeniedException" in msg:
+            return STATUS_IAM_PERMISSION_DENIED, f"IAM permissions denied: {error_msg}"
+        if "service control policy" in msg.lower() or "scp" in msg.lower():
+            return STATUS_SCP_DENIED, "Blocked by Service Control Policy"
+        if code in ("ThrottlingException", "TooManyRequestsException"):
+            return STATUS_THROTTLED, "API rate limit exceeded"
+        if code == "OptInRequired":
+            return STATUS_REGION_NOT_OPTED_IN, "Region not enabled in account"
+        if code == "UnrecognizedClientException":
+            return STATUS_REGION_NOT_ENABLED, "Region not enabled in account"
+        return STATUS_ERROR, f"{code}: {error_msg}" if code else error_msg[:500]
+
+    if "UninitializedAccountException" in msg or "not initialized" in msg.lower():
+        return STATUS_NOT_INITIALIZED, "DRS not initialized in region"
+    if "UnrecognizedClientException" in msg or "security token" in msg.lower():
+        return STATUS_REGION_NOT_ENABLED, "Region not enabled in account"
+    if "Could not connect" in msg or "EndpointConnectionError" in msg:
+        return STATUS_ENDPOINT_UNREACHABLE, "Cannot connect to DRS endpoint"
+    return STATUS_ERROR, msg[:500]
+
+
+def _account_id(account) -> Optional[str]:
+    if isinstance(account, dict):
+        return account.get("accountId")
+    return account
+
+
+def fan_out(
+    func: Callable,
+    regions: Sequence[str],
+    accounts: Optional[Sequence] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    deadline: Optional[float] = None,
+) -> List[Dict]:
+    """
+    Run func across regions (or accounts x regions) under the shared deadline.
+
+    func is called as func(region), or func(account, region) when accounts is
+    given. Exceptions are classified per cell and never propagate.
+
+    Args:
+        func: Per-cell function
+        regions: Regions to query
+        accounts: Optional accounts (IDs or account dicts with accountId)
+        max_workers: Maximum concurrent calls
+        deadline: Explicit monotonic deadline; defaults to the invocation deadline
+
+    Returns:
+        One cell per (account, region) in input order:
+        {
+            "accountId": str or None,
+            "region": str,
+            "status": str,          # Region status (ACTIVE on success)
+            "result": Any,          # func return value, None on failure
+            "errorMessage": str or None
+        }
+    """
+    if accounts is None:
+        matrix = [(None, region) for region in regions]
+    else:
+        matrix = [(account, region) for account in accounts for region in regions]
+
+    if not matrix:
+        return []
+
+    def run(account, region):
+        if accounts is None:
+            return func(region)
+        return func(account, region)
+
+    cells = [
+        {
+            "accountId": _account_id(account),
+            "region": region,
+            "status": STATUS_TIMEOUT,
+            "result": None,
+            "errorMessage": "Deadline reached before region was queried",
+        }
+        for account, region in matrix
+    ]
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(matrix))))
+    try:
+        futures = {executor.submit(run, account, region): idx for idx, (account, region) in enumerate(matrix)}
+        done, not_done = wait(futures, timeout=get_remaining_seconds(deadline))
+
+        for future in done:
+            cell = cells[futures[future]]
+            try:
+                cell["result"] = future.result()
+                cell["status"] = STATUS_ACTIVE
+                cell["errorMessage"] = None
+            except Exception as e:
+                cell["status"], cell["errorMessage"] = classify_region_error(e)
+
+        if not_done:
+            timed_out = [f"{cells[futures[f]]['accountId'] or 'current'}/{cells[futures[f]]['region']}" for f in not_done]
+            logger.warning(f"Fan-out deadline reached, returning partial results; pending: {', '.join(timed_out)}")
+    finally:
+        # Do not block on stragglers past the deadline; queued cells are cancelled
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return cells
@@ -0,0 +1,358 @@
+# Copyright Amazon.com and Affiliates. All rights reserved.
+# This deliverable is considered Developed Content as defined in the AWS Service Terms.
+
+"""
+Bounded In-Memory Response Cache
+
+LRU cache with per-entry TTLs for read-only API responses held at module
+level, so entries survive warm Lambda invocations. The cache is bounded both
+by entry count and by approximate serialized size, and evicts least recently
+used entries first.
+
+Features:
+    - Per-entry TTL: each key can carry its own freshness window
+    - Single-flight: concurrent misses for the same key share one computation
+    - Stale-while-revalidate: expired entries inside the stale window are served
+      immediately while one background thread recomputes them
+    - Namespaces: keys are "namespace:rest"; invalidating a namespace only
+      touches that namespace's keys
+    - Shared tier: optional second tier (shared.shared_cache.SharedCache)
+      consulted on a local miss before computing, and written after computing
+    - Metrics: hits, misses, stale hits, coalesced waits, evictions, expirations
+
+Key Functions:
+    - ResponseCache.get_or_compute(): Cached value or single-flight recompute
+    - ResponseCache.get() / set(): Direct access (fresh entries only)
+    - ResponseCache.invalidate(): Drop one namespace or everything
+    - ResponseCache.get_stats(): Counters and current size
+    - clear_all_caches(): Empty every cache in the process (used by tests)
+
+Usage:
+    from shared.response_cache import ResponseCache
+
+    _cache = ResponseCache(max_entries=256, default_ttl=30)
+
+    result = _cache.get_or_compute(
+        f"ec2_subnets:{account_id}:{region}",
+        lambda: _describe_subnets(region, account_id),
+        ttl=300,
+        cacheable=lambda r: r.get("statusCode") == 200,
+    )
+
+Background revalidation runs in a daemon thread. Lambda freezes the container
+between invocations, so a refresh may finish during the next invocation; the
+stale value stays available until it does.
+"""
+
+import json
+import logging
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+DEFAULT_MAX_ENTRIES = 256
+
+# Approximate JSON size budget across all entries (Lambda memory is small)
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+DEFAULT_TTL_SECONDS = 30
+
+# Every cache created in this process, for clear_all_caches()
+_caches: "weakref.WeakSet[ResponseCache]" = weakref.WeakSet()
+
+
+def _namespace(key: str) -> str:
+    return key.split(":", 1)[0]
+
+
+def _estimate_size(value: Any) -> int:
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return len(repr(value))
+
+
+class _InFlight:
+    """A computation other callers for the same key can wait on."""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache with per-entry TTL, single-flight and stale-while-revalidate.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        default_ttl: float = DEFAULT_TTL_SECONDS,
+        stale_ttl: float = 0,
+        name: str = "",
+        shared_tier=None,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self.shared_tier = shared_tier
+
+        # {key: {"value": Any, "expiresAt": float, "staleUntil": float, "size": int}}
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._namespaces: Dict[str, Set[str]] = {}
+        self._in_flight: Dict[str, _InFlight] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "staleHits": 0,
+            "coalesced": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "refreshes": 0,
+            "sharedHits": 0,
+        }
+        _caches.add(self)
+
+    # ------------------------------------------------------------------
+    # Internal helpers (caller holds self._lock)
+    # ------------------------------------------------------------------
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._bytes -= entry["size"]
+        keys = self._namespaces.get(_namespace(key))
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._namespaces[_namespace(key)]
+
+    def _store(self, key: str, value: Any, ttl: Optional[float], stale_ttl: Optional[float]) -> None:
+        size = _estimate_size(value)
+        if size > self.max_bytes:
+            logger.warning(f"Response cache {self.name}: {key} ({size} bytes) exceeds cache size, not cached")
+            return
+
+        self._remove(key)
+        now = time.monotonic()
+        expires_at = now + (self.default_ttl if ttl is None else ttl)
+        self._entries[key] = {
+            "value": value,
+            "expiresAt": expires_at,
+            "staleUntil": expires_at + (self.stale_ttl if stale_ttl is None else stale_ttl),
+            "size": size,
+        }
+        self._namespaces.setdefault(_namespace(key), set()).add(key)
+        self._bytes += size
+
+        # Evict least recently used entries until within bounds
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self._stats["evictions"] += 1
+
+    def _lookup(self, key: str):
+        """Return (entry, state) where state is "fresh", "stale" or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None, None
+
+        now = time.monotonic()
+        if now < entry["expiresAt"]:
+            self._entries.move_to_end(key)
+            return entry, "fresh"
+        if now < entry["staleUntil"]:
+            self._entries.move_to_end(key)
+            return entry, "stale"
+
+        self._remove(key)
+        self._stats["expirations"] += 1
+        return None, None
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the fresh value for key, or None."""
+        with self._lock:
+            entry, state = self._lookup(key)
+            if state == "fresh":
+                self._stats["hits"] += 1
+                return entry["value"]
+            self._stats["misses"] += 1
+            return None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None, stale_ttl: Optional[float] = None) -> None:
+        """Store value under key with an optional per-entry TTL and stale window."""
+        with self._lock:
+            self._store(key, value, ttl, stale_ttl)
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        ttl: Optional[float] = None,
+        stale_ttl: Optional[float] = None,
+        cacheable: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """
+        Return the cached value for key, computing it at most once concurrently.
+
+        Args:
+            key: Cache key ("namespace:rest")
+            compute: Zero-argument function producing the value
+            ttl: Freshness window in seconds (default: cache default_ttl)
+            stale_ttl: Extra seconds an expired value may be served while it is
+                refreshed in the background (default: cache stale_ttl)
+            cacheable: Predicate deciding whether a computed value is stored
+                (e.g. only successful API responses)
+
+        Returns:
+            Fresh, stale or newly computed value
+        """
+        with self._lock:
+            entry, state = self._lookup(key)
+            if state == "fresh":
+                self._stats["hits"] += 1
+                return entry["value"]
+
+            if state == "stale":
+                self._stats["staleHits"] += 1
+                if key not in self._in_flight:
+                    self._in_flight[key] = _InFlight()
+                    self._stats["refreshes"] += 1
+                    threading.Thread(
+                        target=self._refresh,
+                        args=(key, compute, ttl, stale_ttl, cacheable),
+                        daemon=True,
+                    ).start()
+                return entry["value"]
+
+            in_flight = self._in_flight.get(key)
+            if in_flight is None:
+                in_flight = _InFlight()
+                self._in_flight[key] = in_flight
+                self._stats["misses"] += 1
+                owner = True
+            else:
+                self._stats["coalesced"] += 1
+                owner = False
+
+        if owner:
+            return self._compute_and_store(key, compute, ttl, stale_ttl, cacheable)
+
+        in_flight.event.wait()
+        if in_flight.error is not None:
+            raise in_flight.error
+        return in_flight.value
+
+    def _refresh(self, key, compute, ttl, stale_ttl, cacheable) -> None:
+        """Background revalidation; failures keep serving the stale value."""
+        try:
+            self._compute_and_store(key, compute, ttl, stale_ttl, cacheable)
+        except Exception as e:
+            logger.warning(f"Response cache {self.name}: background refresh of {key} failed: {e}")
+
+    def _compute_and_store(self, key, compute, ttl, stale_ttl, cacheable) -> Any:
+        with self._lock:
+            in_flight = self._in_flight[key]
+
+        ttl = self.default_ttl if ttl is None else ttl
+        shared_entry = None
+        try:
+            if self.shared_tier is not None:
+                # Another container may already have computed this key
+                shared_entry = self.shared_tier.get(key)
+                if shared_entry and shared_entry["hit"]:
+                    value = shared_entry["value"]
+                    remaining = shared_entry["expiresAt"] - time.time()
+                    with self._lock:
+                        self._stats["sharedHits"] += 1
+                        self._store(key, value, min(ttl, remaining), stale_ttl)
+                        self._in_flight.pop(key, None)
+                    in_flight.value = value
+                    in_flight.event.set()
+                    return value
+
+            value = compute()
+        except BaseException as e:
+            in_flight.error = e
+            with self._lock:
+                self._in_flight.pop(key, None)
+            in_flight.event.set()
+            raise
+
+        store = cacheable is None or cacheable(value)
+        with self._lock:
+            if store:
+                self._store(key, value, ttl, stale_ttl)
+            self._in_flight.pop(key, None)
+        in_flight.value = value
+        in_flight.event.set()
+
+        if store and self.shared_tier is not None:
+            if shared_entry is None:
+                self.shared_tier.set(key, value, ttl)
+            else:
+                # Skip the write if another container stored a newer value meanwhile
+                self.shared_tier.compare_and_set(
+                    key, value, shared_entry["version"], ttl, generation=shared_entry["generation"]
+                )
+        return value
+
+    def invalidate(self, namespace: Optional[str] = None) -> int:
+        """
+        Drop every entry in a namespace, or all entries.
+
+        Args:
+            namespace: Key namespace (the part before the first ":"); None clears all
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            if namespace is None:
+                count = len(self._entries)
+                self._entries.clear()
+                self._namespaces.clear()
+                self._bytes = 0
+                return count
+
+            keys = list(self._namespaces.get(namespace, ()))
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def get_stats(self) -> Dict:
+        """Return counters plus current entry count and size."""
+        with self._lock:
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "maxEntries": self.max_entries,
+                "maxBytes": self.max_bytes,
+            }
+
+
+def clear_all_caches() -> None:
+    """Empty every ResponseCache in the process (used by tests)."""
+    for cache in list(_caches):
+        cache.invalidate()
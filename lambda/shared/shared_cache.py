@@ -0,0 +1,355 @@
+# Copyright Amazon.com and Affiliates. All rights reserved.
+# This deliverable is considered Developed Content as defined in the AWS Service Terms.
+
+"""
+Cross-Container Shared Cache (DynamoDB TTL Table)
+
+Second cache tier behind the in-memory ResponseCache. API Gateway spreads
+requests over many Lambda containers, and each new container would otherwise
+pay for the full multi-region scan itself. Entries written by one container
+are read by the others until they expire.
+
+Table Schema (RESPONSE_CACHE_TABLE):
+    - cacheKey (S, hash key): "namespace:rest", same keys as the in-memory tier
+    - namespace (S): Key namespace
+    - payload (B): zlib-compressed JSON value
+    - version (N): Incremented on every write (compare-and-set token)
+    - generation (N): Namespace generation the entry was written under
+    - expiresAt (N): Epoch seconds after which the entry is ignored
+    - TTL (N): Same as expiresAt; lets DynamoDB delete expired items
+
+    Namespace records ("__namespace__#<namespace>") hold a generation counter.
+    Invalidating a namespace increments it, which retires every entry written
+    under an older generation without scanning the table.
+
+Key Functions:
+    - SharedCache.get(): Entry with hit flag, value, version and namespace generation
+    - SharedCache.set(): Unconditional write, returns the new version
+    - SharedCache.compare_and_set(): Write only if the version still matches
+    - SharedCache.invalidate() / invalidate_namespace(): Explicit invalidation
+    - invalidate_namespaces(): Called by sync jobs after data changes
+
+Usage:
+    from shared.shared_cache import NAMESPACE_COMBINED_CAPACITY, invalidate_namespaces
+
+    invalidate_namespaces(NAMESPACE_COMBINED_CAPACITY)
+
+The tier is disabled when RESPONSE_CACHE_TABLE is not set, and DynamoDB
+errors are logged and treated as misses so the cache never fails a request.
+"""
+
+import json
+import logging
+import time
+import zlib
+from typing import Any, Dict, Optional
+
+import boto3
+from boto3.dynamodb.conditions import Attr
+from botocore.exceptions import ClientError
+
+from shared.dynamodb_tables import get_table
+from shared.response_utils import DecimalEncoder
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+RESPONSE_CACHE_TABLE_ENV = "RESPONSE_CACHE_TABLE"
+
+# Namespaces shared between the query handler (writer) and sync jobs (invalidators)
+NAMESPACE_COMBINED_CAPACITY = "combined_capacity"
+NAMESPACE_ALL_ACCOUNTS_CAPACITY = "all_accounts_capacity"
+NAMESPACE_DRS_REGIONAL_CAPACITY = "drs_regional_capacity"
+NAMESPACE_STAGING_ACCOUNTS = "staging_accounts"
+NAMESPACE_EC2_SUBNETS = "ec2_subnets"
+NAMESPACE_EC2_SECURITY_GROUPS = "ec2_security_groups"
+NAMESPACE_EC2_INSTANCE_PROFILES = "ec2_instance_profiles"
+NAMESPACE_EC2_INSTANCE_TYPES = "ec2_instance_types"
+
+CAPACITY_NAMESPACES = (
+    NAMESPACE_COMBINED_CAPACITY,
+    NAMESPACE_ALL_ACCOUNTS_CAPACITY,
+    NAMESPACE_DRS_REGIONAL_CAPACITY,
+)
+
+# DynamoDB items are limited to 400 KB; leave room for the other attributes
+MAX_PAYLOAD_BYTES = 350 * 1024
+
+_NAMESPACE_RECORD_PREFIX = "__namespace__#"
+
+_dynamodb = None
+
+
+def _get_dynamodb_resource():
+    """Get or create the module-level DynamoDB resource (for batch_get_item)."""
+    global _dynamodb
+    if _dynamodb is None:
+        _dynamodb = boto3.resource("dynamodb")
+    return _dynamodb
+
+
+def _namespace(key: str) -> str:
+    return key.split(":", 1)[0]
+
+
+def _namespace_record_key(namespace: str) -> str:
+    return f"{_NAMESPACE_RECORD_PREFIX}{namespace}"
+
+
+def _encode(value: Any) -> bytes:
+    return zlib.compress(json.dumps(value, cls=DecimalEncoder).encode("utf-8"))
+
+
+def _decode(payload) -> Any:
+    # boto3 returns Binary attributes wrapped in boto3.dynamodb.types.Binary
+    raw = payload.value if hasattr(payload, "value") else payload
+    return json.loads(zlib.decompress(bytes(raw)).decode("utf-8"))
+
+
+class SharedCache:
+    """
+    Versioned cache entries in a DynamoDB table with TTL.
+    """
+
+    def __init__(self, env_var: str = RESPONSE_CACHE_TABLE_ENV, table=None):
+        self.env_var = env_var
+        self._table = table
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "conflicts": 0, "errors": 0}
+
+    @property
+    def table(self):
+        if self._table is None:
+            self._table = get_table(self.env_var)
+        return self._table
+
+    @property
+    def enabled(self) -> bool:
+        return self.table is not None
+
+    def _get_generation(self, namespace: str) -> int:
+        item = self.table.get_item(Key={"cacheKey": _namespace_record_key(namespace)}).get("Item")
+        return int(item.get("generation", 0)) if item else 0
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Read an entry and the current generation of its namespace.
+
+        Args:
+            key: Cache key ("namespace:rest")
+
+        Returns:
+            None if the tier is disabled or the read failed, otherwise:
+            {
+                "hit": bool,            # False if absent, expired or invalidated
+                "value": Any,           # None unless hit
+                "version": int or None, # Current version (for compare_and_set)
+                "expiresAt": float,     # Epoch seconds (0 unless hit)
+                "generation": int       # Current namespace generation
+            }
+        """
+        if not self.enabled:
+            return None
+
+        namespace = _namespace(key)
+        try:
+            result = _get_dynamodb_resource().batch_get_item(
+                RequestItems={
+                    self.table.name: {
+                        "Keys": [
+                            {"cacheKey": key},
+                            {"cacheKey": _namespace_record_key(namespace)},
+                        ]
+                    }
+                }
+            )
+            items = {item["cacheKey"]: item for item in result.get("Responses", {}).get(self.table.name, [])}
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.warning(f"Shared cache read failed for {key}: {e}")
+            return None
+
+        ns_item = items.get(_namespace_record_key(namespace))
+        generation = int(ns_item.get("generation", 0)) if ns_item else 0
+        item = items.get(key)
+        entry = {
+            "hit": False,
+            "value": None,
+            "version": int(item["version"]) if item else None,
+            "expiresAt": 0,
+            "generation": generation,
+        }
+
+        if not item or float(item.get("expiresAt", 0)) <= time.time() or int(item.get("generation", 0)) != generation:
+            self._stats["misses"] += 1
+            return entry
+
+        try:
+            entry["value"] = _decode(item["payload"])
+        except (ValueError, zlib.error) as e:
+            self._stats["errors"] += 1
+            logger.warning(f"Shared cache entry {key} could not be decoded: {e}")
+            return entry
+
+        self._stats["hits"] += 1
+        entry["hit"] = True
+        entry["expiresAt"] = float(item["expiresAt"])
+        return entry
+
+    def _write(self, key: str, value: Any, ttl: float, generation: Optional[int], condition) -> Optional[int]:
+        payload = _encode(value)
+        if len(payload) > MAX_PAYLOAD_BYTES:
+            logger.warning(f"Shared cache entry {key} is {len(payload)} bytes compressed, not cached")
+            return None
+
+        namespace = _namespace(key)
+        if generation is None:
+            generation = self._get_generation(namespace)
+        expires_at = int(time.time() + ttl)
+
+        kwargs = {
+            "Key": {"cacheKey": key},
+            "UpdateExpression": (
+                "SET #ns = :ns, payload = :payload, generation = :generation, "
+                "expiresAt = :expires, #ttl = :expires ADD version :one"
+            ),
+            "ExpressionAttributeNames": {"#ns": "namespace", "#ttl": "TTL"},
+            "ExpressionAttributeValues": {
+                ":ns": namespace,
+                ":payload": payload,
+                ":generation": generation,
+                ":expires": expires_at,
+                ":one": 1,
+            },
+            "ReturnValues": "UPDATED_NEW",
+        }
+        if condition is not None:
+            kwargs["ConditionExpression"] = condition
+
+        result = self.table.update_item(**kwargs)
+        self._stats["writes"] += 1
+        return int(result["Attributes"]["version"])
+
+    def set(self, key: str, value: Any, ttl: float, generation: Optional[int] = None) -> Optional[int]:
+        """
+        Write an entry unconditionally.
+
+        Args:
+            key: Cache key ("namespace:rest")
+            value: JSON-serializable value
+            ttl: Seconds until the entry expires
+            generation: Namespace generation observed before computing value
+                (from get()); read from the table when omitted
+
+        Returns:
+            New version, or None if the write was skipped or failed
+        """
+        if not self.enabled:
+            return None
+        try:
+            return self._write(key, value, ttl, generation, condition=None)
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.warning(f"Shared cache write failed for {key}: {e}")
+            return None
+
+    def compare_and_set(
+        self,
+        key: str,
+        value: Any,
+        expected_version: Optional[int],
+        ttl: float,
+        generation: Optional[int] = None,
+    ) -> bool:
+        """
+        Write an entry only if its version still equals expected_version.
+
+        Args:
+            key: Cache key ("namespace:rest")
+            value: JSON-serializable value
+            expected_version: Version from get(), or None if the entry must not exist
+            ttl: Seconds until the entry expires
+            generation: Namespace generation observed before computing value
+
+        Returns:
+            True if written, False if another writer got there first (or on error)
+        """
+        if not self.enabled:
+            return False
+
+        if expected_version is None:
+            condition = Attr("cacheKey").not_exists()
+        else:
+            condition = Attr("version").eq(expected_version)
+
+        try:
+            return self._write(key, value, ttl, generation, condition=condition) is not None
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException":
+                self._stats["conflicts"] += 1
+                return False
+            self._stats["errors"] += 1
+            logger.warning(f"Shared cache compare-and-set failed for {key}: {e}")
+            return False
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.warning(f"Shared cache compare-and-set failed for {key}: {e}")
+            return False
+
+    def invalidate(self, key: str) -> None:
+        """Delete a single entry."""
+        if not self.enabled:
+            return
+        try:
+            self.table.delete_item(Key={"cacheKey": key})
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.warning(f"Shared cache invalidation failed for {key}: {e}")
+
+    def invalidate_namespace(self, namespace: str) -> None:
+        """Retire every entry in a namespace by bumping its generation."""
+        if not self.enabled:
+            return
+        try:
+            self.table.update_item(
+                Key={"cacheKey": _namespace_record_key(namespace)},
+                UpdateExpression="SET #ns = :ns ADD generation :one",
+                ExpressionAttributeNames={"#ns": "namespace"},
+                ExpressionAttributeValues={":ns": namespace, ":one": 1},
+            )
+            logger.info(f"Invalidated shared cache namespace {namespace}")
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.warning(f"Shared cache invalidation failed for namespace {namespace}: {e}")
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return hit/miss/write/conflict/error counters."""
+        return dict(self._stats)
+
+
+_default_cache: Optional[SharedCache] = None
+
+
+def get_shared_cache() -> SharedCache:
+    """Return the process-wide SharedCache for RESPONSE_CACHE_TABLE."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = SharedCache()
+    return _default_cache
+
+
+def invalidate_namespaces(*namespaces: str) -> None:
+    """
+    Invalidate shared cache namespaces after the underlying data changed.
+
+    In-memory tiers in other containers keep their copy until its own
+    (short) TTL expires.
+    """
+    cache = get_shared_cache()
+    for namespace in namespaces:
+        cache.invalidate_namespace(namespace)
+
+
+def reset_shared_cache() -> None:
+    """Drop the process-wide SharedCache (used by tests)."""
+    global _default_cache
+    _default_cache = None
@@ -0,0 +1,233 @@
+# Copyright Amazon.com and Affiliates. All rights reserved.
+# This deliverable is considered Developed Content as defined in the AWS Service Terms.
+
+"""
+Inverted Tag Index for Tag-Based Protection Groups
+
+Maps normalized DRS source server tags to server IDs so tag-based server
+selection becomes a set intersection of a few indexed lookups instead of a
+full region listing filtered in Python. The inventory sync rebuilds the index
+for every (account, region) it reads from DRS.
+
+Table Schema (SERVER_TAG_INDEX_TABLE):
+    - tagKey (S, hash key): "{accountId}#{region}#{key}={value}" (normalized)
+    - sourceServerID (S, range key): DRS source server ID
+    - syncedAt (S): ISO timestamp of the sync that wrote the entry
+    - TTL (N): Epoch seconds; removes entries no sync has refreshed
+
+    Sync markers ("{accountId}#{region}#__synced__", "__marker__") record the
+    last completed sync of an (account, region). Lookups only accept entries
+    written by that sync or a later one, so a tag removed from a server drops
+    out of results as soon as the next sync completes, without deleting the
+    old entries first.
+
+Tag Matching Rules (same as the DRS API path in query_drs_servers_by_tags):
+    - Server must have ALL specified tags (AND logic)
+    - Keys and values are stripped of surrounding whitespace
+    - Values are compared case-insensitively
+    - DRS source server tags are indexed, not EC2 instance tags
+
+Key Functions:
+    - normalize_tag(): Normalized (key, value) pair
+    - sync_tag_index(): Rebuild the index for one account and region
+    - resolve_servers_by_tags(): Server IDs matching all tags, or None
+    - get_index_account_id(): Account the index is keyed by for a context
+
+Usage:
+    from shared.tag_index import resolve_servers_by_tags
+
+    server_ids = resolve_servers_by_tags(account_id, region, {"Environment": "prod"})
+    if server_ids is None:
+        server_ids = ...  # Index unavailable or stale: fall back to DRS API
+
+resolve_servers_by_tags() returns None (never raises) when the table is not
+configured, the (account, region) has not been synced recently or a read
+fails, so callers keep their existing DRS API path as the fallback.
+"""
+
+import time
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from boto3.dynamodb.conditions import Attr, Key
+
+from shared.dynamodb_tables import get_table
+
+SERVER_TAG_INDEX_TABLE_ENV = "SERVER_TAG_INDEX_TABLE"
+
+_MARKER_TAG = "__synced__"
+_MARKER_SERVER_ID = "__marker__"
+
+# Accept the index while it is at most two inventory sync intervals old
+MAX_INDEX_AGE_MINUTES = 30
+
+# Entries not refreshed by a sync for this long are removed by DynamoDB TTL
+ENTRY_TTL_SECONDS = 24 * 3600
+
+
+def get_tag_index_table():
+    """Return the tag index table, or None if SERVER_TAG_INDEX_TABLE is unset."""
+    return get_table(SERVER_TAG_INDEX_TABLE_ENV)
+
+
+def normalize_tag(key: str, value) -> Tuple[str, str]:
+    """
+    Normalize a tag for indexing and lookup.
+
+    Args:
+        key: Tag key
+        value: Tag value
+
+    Returns:
+        Tuple of (stripped key, stripped lower-cased value)
+    """
+    return str(key).strip(), str(value).strip().lower()
+
+
+def _partition(account_id: str, region: str) -> str:
+    return f"{account_id}#{region}"
+
+
+def _tag_key(account_id: str, region: str, key: str, value) -> str:
+    norm_key, norm_value = normalize_tag(key, value)
+    return f"{_partition(account_id, region)}#{norm_key}={norm_value}"
+
+
+def _marker_key(account_id: str, region: str) -> str:
+    return f"{_partition(account_id, region)}#{_MARKER_TAG}"
+
+
+def get_index_account_id(account_context: Optional[Dict] = None) -> str:
+    """
+    Return the account ID tag index entries are keyed by for a context.
+
+    Contexts without an accountId resolve to the Lambda's own account, which
+    the inventory sync indexes under its own ID.
+    """
+    if account_context and account_context.get("accountId"):
+        return account_context["accountId"]
+
+    from shared.cross_account import get_current_account_id
+
+    return get_current_account_id()
+
+
+def sync_tag_index(account_id: str, region: str, servers: Iterable[Dict], synced_at: Optional[str] = None) -> int:
+    """
+    Rebuild the tag index for one account and region from a DRS listing.
+
+    Writes one entry per (server, tag) and then advances the sync marker.
+    Entries from earlier syncs are ignored by lookups once the marker moves
+    and expire through TTL.
+
+    Args:
+        account_id: Account the servers were listed in
+        region: Region the servers were listed in
+        servers: DRS source servers (describe_source_servers items)
+        synced_at: ISO timestamp for this sync (default: now)
+
+    Returns:
+        Number of index entries written (0 if the table is not configured)
+    """
+    table = get_tag_index_table()
+    if table is None:
+        return 0
+
+    synced_at = synced_at or datetime.now(timezone.utc).isoformat()
+    expires_at = int(time.time() + ENTRY_TTL_SECONDS)
+
+    written = 0
+    with table.batch_writer(overwrite_by_pkeys=["tagKey", "sourceServerID"]) as batch:
+        for server in servers:
+            server_id = server.get("sourceServerID")
+            if not server_id:
+                continue
+            for key, value in (server.get("tags") or {}).items():
+                batch.put_item(
+                    Item={
+                        "tagKey": _tag_key(account_id, region, key, value),
+                        "sourceServerID": server_id,
+                        "syncedAt": synced_at,
+                        "TTL": expires_at,
+                    }
+                )
+                written += 1
+
+    # Marker last: a sync that fails midway leaves the previous snapshot in effect
+    table.put_item(
+        Item={
+            "tagKey": _marker_key(account_id, region),
+            "sourceServerID": _MARKER_SERVER_ID,
+            "syncedAt": synced_at,
+            "entryCount": written,
+        }
+    )
+    return written
+
+
+def _query_server_ids(table, tag_key: str, synced_at: str) -> Set[str]:
+    kwargs = {
+        "KeyConditionExpression": Key("tagKey").eq(tag_key),
+        "FilterExpression": Attr("syncedAt").gte(synced_at),
+        "ProjectionExpression": "sourceServerID",
+    }
+    server_ids = set()
+    while True:
+        result = table.query(**kwargs)
+        server_ids.update(item["sourceServerID"] for item in result.get("Items", []))
+        if "LastEvaluatedKey" not in result:
+            return server_ids
+        kwargs["ExclusiveStartKey"] = result["LastEvaluatedKey"]
+
+
+def resolve_servers_by_tags(
+    account_id: str,
+    region: str,
+    tags: Dict[str, str],
+    max_age_minutes: int = MAX_INDEX_AGE_MINUTES,
+) -> Optional[List[str]]:
+    """
+    Return IDs of servers that have ALL tags, using the inverted index.
+
+    Args:
+        account_id: Account whose DRS servers are searched
+        region: AWS region
+        tags: Tag key-value pairs that must all match
+        max_age_minutes: Oldest sync marker accepted
+
+    Returns:
+        Sorted list of source server IDs, or None if the index cannot answer
+        (not configured, never synced, stale, read failure or no tags)
+    """
+    if not tags:
+        return None
+
+    table = get_tag_index_table()
+    if table is None:
+        return None
+
+    try:
+        marker = table.get_item(
+            Key={"tagKey": _marker_key(account_id, region), "sourceServerID": _MARKER_SERVER_ID}
+        ).get("Item")
+        if not marker:
+            return None
+
+        synced_at = marker["syncedAt"]
+        age_seconds = (datetime.now(timezone.utc) - datetime.fromisoformat(synced_at)).total_seconds()
+        if age_seconds > max_age_minutes * 60:
+            print(f"Tag index for {account_id}/{region} is {int(age_seconds)}s old, not used")
+            return None
+
+        matching: Optional[Set[str]] = None
+        for key, value in tags.items():
+            server_ids = _query_server_ids(table, _tag_key(account_id, region, key, value), synced_at)
+            matching = server_ids if matching is None else matching & server_ids
+            if not matching:
+                break
+
+        return sorted(matching or [])
+
+    except Exception as e:
+        print(f"Tag index lookup failed for {account_id}/{region}: {e}")
+        return None
@@ -303,6 +303,14 @@ def extract_condition_keys(statements: List[Dict[str, Any]], action: str) -> Dic
     return {}
 
 
+def _is_response_cache_statement(statement: Dict[str, Any]) -> bool:
+    """Return True if every resource in the statement is the response cache table."""
+    resources = statement.get("Resource", [])
+    if not isinstance(resources, list):
+        resources = [resources]
+    return bool(resources) and all("-response-cache-" in json.dumps(r) for r in resources)
+
+
 # ============================================================================
 # Property 1: Query Handler Read-Only Access
 # ============================================================================
@@ -335,6 +343,10 @@ def test_property_1_query_handler_read_only_access(operation):
     Validates: Requirements 1.2, 1.3, 1.4, 1.8, 1.9
     """
     statements = extract_policy_statements(IAM_TEMPLATE, "QueryHandlerRole")
+
+    # The shared response cache table is the only resource the Query Handler
+    # may write; every other project resource stays read-only
+    statements = [s for s in statements if not _is_response_cache_statement(s)]
     
     action, should_be_allowed = operation
     is_allowed = check_action_allowed(statements, action)
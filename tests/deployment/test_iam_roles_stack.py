@@ -919,12 +919,30 @@ class TestRolePermissionScoping:
         for policy in policies:
             policy_name = policy["PolicyName"]
             
-            # Should only have read-only policies
+            # Should only have read-only policies (plus writes to the shared response cache)
             assert "ReadOnly" in policy_name or policy_name in [
                 "STSAssumeRole",
                 "LambdaInvoke",
                 "CloudWatchMetrics",
-                "CloudWatchLogs"
+                "CloudWatchLogs",
+                "ResponseCacheWrite"
+            ]
+
+    def test_query_handler_response_cache_write_scoped_to_cache_table(self, load_cfn_template):
+        """Test that QueryHandlerRole can only write to the response cache table."""
+        # Arrange & Act
+        template = load_cfn_template("iam/roles-stack.yaml")
+        role = template["Resources"]["QueryHandlerRole"]
+        policy = next(p for p in role["Properties"]["Policies"] if p["PolicyName"] == "ResponseCacheWrite")
+
+        # Assert
+        for statement in policy["PolicyDocument"]["Statement"]:
+            assert all(action.startswith("dynamodb:") for action in statement["Action"])
+            assert statement["Resource"] == [
+                {
+                    "Sub": "arn:${AWS::Partition}:dynamodb:${AWS::Region}:${AWS::AccountId}"
+                    ":table/${ProjectName}-response-cache-${Environment}"
+                }
             ]
 
     def test_data_management_role_has_no_recovery_permissions(self, load_cfn_template):
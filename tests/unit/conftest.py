@@ -132,6 +132,54 @@ def reset_module_caches():
     except ImportError:
         pass
 
+    try:
+        import shared.credential_cache as credential_cache
+        # Reset cached STS credentials so a far-future Expiration returned by
+        # one test's mock cannot satisfy a later test's assume_role assertion.
+        credential_cache.reset_cache()
+    except ImportError:
+        pass
+
+    try:
+        import shared.client_registry as client_registry
+        # Drop pooled boto3 clients so a mock client built under one test's
+        # patch is never handed to a later test.
+        client_registry.clear_registry()
+    except ImportError:
+        pass
+
+    try:
+        import shared.rate_limiter as rate_limiter
+        # Fresh token buckets so throttling simulated in one test does not
+        # slow down the next.
+        rate_limiter.reset_rate_limiters()
+    except ImportError:
+        pass
+
+    try:
+        import shared.region_fanout as region_fanout
+        # Clear the fan-out deadline recorded by a previous lambda_handler call
+        # so later tests run with the default budget.
+        region_fanout._invocation_deadline = None
+    except ImportError:
+        pass
+
+    try:
+        import shared.response_cache as response_cache
+        # Empty query-handler response caches so a response built from one
+        # test's mocks is never served to the next.
+        response_cache.clear_all_caches()
+    except ImportError:
+        pass
+
+    try:
+        import shared.shared_cache as shared_cache
+        # Drop the process-wide shared cache so a table handle resolved under
+        # one test's environment is not reused by the next.
+        shared_cache.reset_shared_cache()
+    except ImportError:
+        pass
+
     try:
         import shared.active_region_filter as active_region_filter
         # Reset active_region_filter module-level cache and table handle.
@@ -0,0 +1,155 @@
+# Copyright Amazon.com and Affiliates. All rights reserved.
+# This deliverable is considered Developed Content as defined in the AWS Service Terms.
+
+"""
+Unit tests for the pooled boto3 client registry.
+
+Covers reuse across calls, key separation by account/region/service/profile,
+rebuilds after credential refresh, account_context resolution and counters.
+"""
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add lambda directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../lambda"))
+
+from shared import credential_cache  # noqa: E402
+from shared.client_registry import (  # noqa: E402
+    CLIENT_PROFILES,
+    MAX_POOL_CONNECTIONS,
+    get_client,
+    get_client_for_account,
+    get_registry_stats,
+)
+
+ROLE_ARN = "arn:aws:iam::222222222222:role/DRSOrchestrationRole"
+
+
+def _credentials(access_key_id: str = "AKIAFIRST") -> dict:
+    return {
+        "AccessKeyId": access_key_id,
+        "SecretAccessKey": "secret",
+        "SessionToken": "token",
+        "Expiration": datetime.now(timezone.utc) + timedelta(hours=1),
+    }
+
+
+@pytest.fixture
+def factory():
+    """boto3.client stand-in returning a new mock per call and a shared STS mock."""
+    sts = MagicMock()
+    sts.assume_role.side_effect = lambda **kwargs: {"Credentials": _credentials()}
+
+    def build(service, **kwargs):
+        if service == "sts":
+            return sts
+        return MagicMock(name=f"{service}-client")
+
+    mock_factory = MagicMock(side_effect=build)
+    mock_factory.sts = sts
+    return mock_factory
+
+
+def _service_calls(factory, service):
+    return [c for c in factory.call_args_list if c.args[0] == service]
+
+
+class TestGetClient:
+    def test_same_key_returns_same_client(self, factory):
+        first = get_client("drs", "us-east-1", client_factory=factory)
+        second = get_client("drs", "us-east-1", client_factory=factory)
+
+        assert first is second
+        assert len(_service_calls(factory, "drs")) == 1
+        stats = get_registry_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["size"] == 1
+
+    def test_clients_are_keyed_by_region_service_and_profile(self, factory):
+        clients = {
+            get_client("drs", "us-east-1", client_factory=factory),
+            get_client("drs", "us-west-2", client_factory=factory),
+            get_client("ec2", "us-east-1", client_factory=factory),
+            get_client("drs", "us-east-1", profile="fast", client_factory=factory),
+        }
+
+        assert len(clients) == 4
+
+    def test_client_is_built_with_pooled_profile_config(self, factory):
+        get_client("drs", "us-east-1", profile="fast", client_factory=factory)
+
+        kwargs = _service_calls(factory, "drs")[0].kwargs
+        assert kwargs["region_name"] == "us-east-1"
+        assert kwargs["config"] is CLIENT_PROFILES["fast"]
+        assert CLIENT_PROFILES["fast"].max_pool_connections == MAX_POOL_CONNECTIONS
+
+    def test_unknown_profile_raises(self, factory):
+        with pytest.raises(ValueError, match="Unknown client profile"):
+            get_client("drs", "us-east-1", profile="turbo", client_factory=factory)
+
+    def test_cross_account_client_uses_cached_credentials(self, factory):
+        first = get_client("drs", "us-east-1", role_arn=ROLE_ARN, external_id="ext", client_factory=factory)
+        second = get_client("drs", "us-east-1", role_arn=ROLE_ARN, external_id="ext", client_factory=factory)
+
+        assert first is second
+        assert factory.sts.assume_role.call_count == 1
+        kwargs = _service_calls(factory, "drs")[0].kwargs
+        assert kwargs["aws_access_key_id"] == "AKIAFIRST"
+
+    def test_client_rebuilt_when_credentials_refresh(self, factory):
+        factory.sts.assume_role.side_effect = [
+            {"Credentials": _credentials("AKIAFIRST")},
+            {"Credentials": _credentials("AKIASECOND")},
+        ]
+
+        first = get_client("drs", "us-east-1", role_arn=ROLE_ARN, client_factory=factory)
+        credential_cache.invalidate_credentials(ROLE_ARN)
+        second = get_client("drs", "us-east-1", role_arn=ROLE_ARN, client_factory=factory)
+
+        assert first is not second
+        assert _service_calls(factory, "drs")[1].kwargs["aws_access_key_id"] == "AKIASECOND"
+        assert get_registry_stats()["rebuilds"] == 1
+
+    def test_concurrent_first_calls_build_one_client(self, factory):
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            clients = list(executor.map(lambda _: get_client("drs", "eu-west-1", client_factory=factory), range(16)))
+
+        assert len(_service_calls(factory, "drs")) == 1
+        assert all(c is clients[0] for c in clients)
+
+
+class TestGetClientForAccount:
+    def test_current_account_context_uses_default_credentials(self, factory):
+        get_client_for_account(
+            "drs", "us-east-1", {"accountId": "111111111111", "isCurrentAccount": True}, client_factory=factory
+        )
+
+        assert factory.sts.assume_role.call_count == 0
+        assert "aws_access_key_id" not in _service_calls(factory, "drs")[0].kwargs
+
+    def test_cross_account_context_builds_role_arn(self, factory):
+        context = {
+            "accountId": "222222222222",
+            "assumeRoleName": "DRSOrchestrationRole",
+            "externalId": "ext",
+            "isCurrentAccount": False,
+        }
+
+        get_client_for_account("ec2", "us-west-2", context, client_factory=factory)
+
+        call_args = factory.sts.assume_role.call_args[1]
+        assert call_args["RoleArn"] == ROLE_ARN
+        assert call_args["ExternalId"] == "ext"
+
+    def test_cross_account_context_requires_role_name(self, factory):
+        with pytest.raises(ValueError, match="AssumeRoleName"):
+            get_client_for_account(
+                "drs", "us-east-1", {"accountId": "222222222222", "isCurrentAccount": False}, client_factory=factory
+            )
@@ -0,0 +1,165 @@
+# Copyright Amazon.com and Affiliates. All rights reserved.
+# This deliverable is considered Developed Content as defined in the AWS Service Terms.
+
+"""
+Unit tests for the shared STS credential cache.
+
+Covers cache hits across calls, refresh ahead of expiry, keying by
+external ID, single-flight refresh under concurrency, and failure handling.
+"""
+
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+# Add lambda directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../lambda"))
+
+from shared import credential_cache  # noqa: E402
+from shared.credential_cache import (  # noqa: E402
+    get_assumed_role_credentials,
+    get_cache_stats,
+    get_client_kwargs,
+    invalidate_credentials,
+)
+
+ROLE_ARN = "arn:aws:iam::123456789012:role/DRSOrchestrationRole"
+
+
+def _credentials(expires_in_seconds: int) -> dict:
+    return {
+        "AccessKeyId": "AKIAEXAMPLE",
+        "SecretAccessKey": "secret",
+        "SessionToken": "token",
+        "Expiration": datetime.now(timezone.utc) + timedelta(seconds=expires_in_seconds),
+    }
+
+
+@pytest.fixture
+def sts_factory():
+    """Client factory returning a mock STS client with 1-hour credentials."""
+    sts = MagicMock()
+    sts.assume_role.side_effect = lambda **kwargs: {"Credentials": _credentials(3600)}
+    factory = MagicMock(return_value=sts)
+    return factory, sts
+
+
+class TestCredentialCache:
+    def test_second_call_is_served_from_cache(self, sts_factory):
+        factory, sts = sts_factory
+
+        first = get_assumed_role_credentials(ROLE_ARN, "ext-1", client_factory=factory)
+        second = get_assumed_role_credentials(ROLE_ARN, "ext-1", client_factory=factory)
+
+        assert first is second
+        assert sts.assume_role.call_count == 1
+        call_args = sts.assume_role.call_args[1]
+        assert call_args["RoleArn"] == ROLE_ARN
+        assert call_args["ExternalId"] == "ext-1"
+        stats = get_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_external_id_is_part_of_cache_key(self, sts_factory):
+        factory, sts = sts_factory
+
+        get_assumed_role_credentials(ROLE_ARN, "ext-1", client_factory=factory)
+        get_assumed_role_credentials(ROLE_ARN, "ext-2", client_factory=factory)
+
+        assert sts.assume_role.call_count == 2
+
+    def test_credentials_inside_refresh_margin_are_refreshed(self, sts_factory):
+        factory, sts = sts_factory
+        sts.assume_role.side_effect = [
+            {"Credentials": _credentials(credential_cache.REFRESH_MARGIN_SECONDS - 10)},
+            {"Credentials": _credentials(3600)},
+        ]
+
+        get_assumed_role_credentials(ROLE_ARN, client_factory=factory)
+        get_assumed_role_credentials(ROLE_ARN, client_factory=factory)
+
+        assert sts.assume_role.call_count == 2
+        assert "ExternalId" not in sts.assume_role.call_args[1]
+
+    def test_credentials_without_expiration_are_not_cached(self, sts_factory):
+        factory, sts = sts_factory
+        sts.assume_role.side_effect = lambda **kwargs: {
+            "Credentials": {"AccessKeyId": "A", "SecretAccessKey": "S", "SessionToken": "T"}
+        }
+
+        get_assumed_role_credentials(ROLE_ARN, client_factory=factory)
+        get_assumed_role_credentials(ROLE_ARN, client_factory=factory)
+
+        assert sts.assume_role.call_count == 2
+
+    def test_iso_string_expiration_is_parsed(self, sts_factory):
+        factory, sts = sts_factory
+        expiration = (datetime.now(timezone.utc) + timedelta(hours=1)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        sts.assume_role.side_effect = lambda **kwargs: {
+            "Credentials": {"AccessKeyId": "A", "SecretAccessKey": "S", "SessionToken": "T", "Expiration": expiration}
+        }
+
+        get_assumed_role_credentials(ROLE_ARN, client_factory=factory)
+        get_assumed_role_credentials(ROLE_ARN, client_factory=factory)
+
+        assert sts.assume_role.call_count == 1
+
+    def test_concurrent_misses_collapse_into_one_sts_call(self, sts_factory):
+        factory, sts = sts_factory
+        started = threading.Event()
+
+        def slow_assume_role(**kwargs):
+            started.set()
+            time.sleep(0.05)
+            return {"Credentials": _credentials(3600)}
+
+        sts.assume_role.side_effect = slow_assume_role
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            results = list(
+                executor.map(lambda _: get_assumed_role_credentials(ROLE_ARN, client_factory=factory), range(10))
+            )
+
+        assert sts.assume_role.call_count == 1
+        assert all(r is results[0] for r in results)
+
+    def test_failures_propagate_and_are_not_cached(self, sts_factory):
+        factory, sts = sts_factory
+        sts.assume_role.side_effect = [
+            ClientError({"Error": {"Code": "AccessDenied", "Message": "denied"}}, "AssumeRole"),
+            {"Credentials": _credentials(3600)},
+        ]
+
+        with pytest.raises(ClientError):
+            get_assumed_role_credentials(ROLE_ARN, client_factory=factory)
+
+        get_assumed_role_credentials(ROLE_ARN, client_factory=factory)
+        assert sts.assume_role.call_count == 2
+        assert get_cache_stats()["errors"] == 1
+
+    def test_invalidate_forces_refresh(self, sts_factory):
+        factory, sts = sts_factory
+
+        get_assumed_role_credentials(ROLE_ARN, "ext-1", client_factory=factory)
+        invalidate_credentials(ROLE_ARN, "ext-1")
+        get_assumed_role_credentials(ROLE_ARN, "ext-1", client_factory=factory)
+
+        assert sts.assume_role.call_count == 2
+
+    def test_client_kwargs_shape(self, sts_factory):
+        factory, _ = sts_factory
+
+        kwargs = get_client_kwargs(ROLE_ARN, client_factory=factory)
+
+        assert kwargs == {
+            "aws_access_key_id": "AKIAEXAMPLE",
+            "aws_secret_access_key": "secret",
+            "aws_session_token": "token",
+        }
@@ -0,0 +1,174 @@
+# Copyright Amazon.com and Affiliates. All rights reserved.
+# This deliverable is considered Developed Content as defined in the AWS Service Terms.
+
+"""
+Unit tests for the adaptive token-bucket rate limiter.
+
+Covers burst and reservation pacing, AIMD adaptation from throttling
+feedback, operation classification, shared limiter keying and the
+drs_api_call_with_backoff integration.
+"""
+
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+# Add lambda directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../lambda"))
+
+from shared.drs_utils import drs_api_call_with_backoff  # noqa: E402
+from shared.rate_limiter import (  # noqa: E402
+    RATE_BUDGETS,
+    AdaptiveRateLimiter,
+    get_operation_class,
+    get_rate_limiter,
+    get_rate_limiter_stats,
+    is_throttling_error,
+)
+
+
+def _throttle(code: str = "ThrottlingException") -> ClientError:
+    return ClientError({"Error": {"Code": code, "Message": "Rate exceeded"}}, "Op")
+
+
+@pytest.fixture
+def mock_sleep():
+    with patch("shared.rate_limiter.time.sleep") as sleep:
+        yield sleep
+
+
+class TestAdaptiveRateLimiter:
+    def test_burst_is_served_without_waiting(self, mock_sleep):
+        limiter = AdaptiveRateLimiter(rate=10.0, burst=5)
+
+        waits = [limiter.acquire() for _ in range(5)]
+
+        assert waits == [0.0] * 5
+        mock_sleep.assert_not_called()
+
+    def test_calls_beyond_burst_are_paced_at_rate(self, mock_sleep):
+        limiter = AdaptiveRateLimiter(rate=10.0, burst=2)
+        with patch("shared.rate_limiter.time.monotonic", return_value=100.0):
+            limiter._updated_at = 100.0
+            waits = [limiter.acquire() for _ in range(4)]
+
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] == pytest.approx(0.1)
+        assert waits[3] == pytest.approx(0.2)
+        assert mock_sleep.call_count == 2
+
+    def test_throttle_halves_rate_and_drains_burst(self, mock_sleep):
+        limiter = AdaptiveRateLimiter(rate=10.0, burst=10)
+
+        limiter.record_throttle()
+
+        assert limiter.rate == pytest.approx(5.0)
+        assert limiter.acquire() > 0
+
+    def test_rate_never_drops_below_floor(self):
+        limiter = AdaptiveRateLimiter(rate=10.0, burst=1, min_rate=2.0)
+
+        for _ in range(10):
+            limiter.record_throttle()
+
+        assert limiter.rate == pytest.approx(2.0)
+
+    def test_success_recovers_rate_additively_up_to_budget(self):
+        limiter = AdaptiveRateLimiter(rate=10.0, burst=1, increase=1.0)
+        limiter.record_throttle()
+
+        for _ in range(3):
+            limiter.record_success()
+        assert limiter.rate == pytest.approx(8.0)
+
+        for _ in range(10):
+            limiter.record_success()
+        assert limiter.rate == pytest.approx(10.0)
+
+    def test_call_records_throttling_and_reraises(self, mock_sleep):
+        limiter = AdaptiveRateLimiter(rate=4.0, burst=4)
+        func = MagicMock(side_effect=_throttle())
+
+        with pytest.raises(ClientError):
+            limiter.call(func, sourceServerID="s-1")
+
+        func.assert_called_once_with(sourceServerID="s-1")
+        assert limiter.get_stats()["throttled"] == 1
+        assert limiter.rate == pytest.approx(2.0)
+
+    def test_call_does_not_penalize_other_errors(self):
+        limiter = AdaptiveRateLimiter(rate=4.0, burst=4)
+        func = MagicMock(side_effect=ClientError({"Error": {"Code": "ValidationException"}}, "Op"))
+
+        with pytest.raises(ClientError):
+            limiter.call(func)
+
+        assert limiter.rate == pytest.approx(4.0)
+
+    def test_invalid_configuration_raises(self):
+        with pytest.raises(ValueError):
+            AdaptiveRateLimiter(rate=0, burst=1)
+        with pytest.raises(ValueError):
+            AdaptiveRateLimiter(rate=1, burst=0)
+
+
+class TestSharedLimiters:
+    def test_operation_classes(self):
+        assert get_operation_class("drs", "describe_jobs") == "read"
+        assert get_operation_class("drs", "get_launch_configuration") == "read"
+        assert get_operation_class("drs", "update_launch_configuration") == "write"
+        assert get_operation_class("drs", "start_recovery") == "recovery"
+        assert get_operation_class("ec2", "create_launch_template_version") == "write"
+        assert get_operation_class("drs", None) == "read"
+
+    def test_limiters_shared_per_account_region_service_and_class(self):
+        first = get_rate_limiter("drs", "us-east-1", operation="describe_jobs")
+        same = get_rate_limiter("drs", "us-east-1", operation="describe_source_servers")
+        other_region = get_rate_limiter("drs", "us-west-2", operation="describe_jobs")
+        other_account = get_rate_limiter("drs", "us-east-1", "222222222222", "describe_jobs")
+        write = get_rate_limiter("drs", "us-east-1", operation="update_launch_configuration")
+
+        assert first is same
+        assert len({id(first), id(other_region), id(other_account), id(write)}) == 4
+
+    def test_limiter_uses_budget_for_class(self):
+        limiter = get_rate_limiter("drs", "us-east-1", operation="start_recovery")
+
+        rate, burst = RATE_BUDGETS["drs"]["recovery"]
+        assert limiter.max_rate == rate
+        assert limiter.burst == burst
+        assert "current/us-east-1/drs/recovery" in get_rate_limiter_stats()
+
+    def test_is_throttling_error(self):
+        assert is_throttling_error(_throttle("TooManyRequestsException"))
+        assert is_throttling_error(_throttle("RequestLimitExceeded"))
+        assert not is_throttling_error(_throttle("ConflictException"))
+        assert not is_throttling_error(ValueError("throttled"))
+
+
+class TestDrsApiCallWithBackoff:
+    def test_throttle_feedback_paces_retry_instead_of_fixed_sleep(self, mock_sleep):
+        client = MagicMock()
+        client.describe_jobs.side_effect = [_throttle(), {"items": []}]
+        limiter = AdaptiveRateLimiter(rate=10.0, burst=10)
+
+        with patch("time.sleep") as fixed_sleep:
+            result = drs_api_call_with_backoff(client, "describe_jobs", rate_limiter=limiter, filters={})
+
+        assert result == {"items": []}
+        assert client.describe_jobs.call_count == 2
+        assert limiter.get_stats()["throttled"] == 1
+        assert limiter.get_stats()["acquired"] == 2
+        # The limiter paced the retry; the legacy base_delay sleep (1.0s) was not used
+        assert 1.0 not in [c.args[0] for c in fixed_sleep.call_args_list]
+
+    def test_returns_none_after_exhausting_retries(self, mock_sleep):
+        client = MagicMock()
+        client.describe_jobs.side_effect = _throttle()
+        limiter = AdaptiveRateLimiter(rate=10.0, burst=10)
+
+        assert drs_api_call_with_backoff(client, "describe_jobs", max_retries=2, rate_limiter=limiter) is None
+        assert limiter.get_stats()["throttled"] == 2
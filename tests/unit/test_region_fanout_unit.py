@@ -0,0 +1,141 @@
+# Copyright Amazon.com and Affiliates. All rights reserved.
+# This deliverable is considered Developed Content as defined in the AWS Service Terms.
+
+"""
+Unit tests for the multi-region fan-out engine.
+
+Covers result cells for regions and account x region matrices, error
+classification with the region status vocabulary, and partial results
+when the invocation deadline runs out.
+"""
+
+import os
+import sys
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError, EndpointConnectionError
+
+# Add lambda directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../lambda"))
+
+from shared import region_fanout  # noqa: E402
+from shared.region_fanout import (  # noqa: E402
+    DEFAULT_BUDGET_SECONDS,
+    classify_region_error,
+    fan_out,
+    get_remaining_seconds,
+    set_invocation_deadline,
+)
+
+
+def _client_error(code: str, message: str = "error") -> ClientError:
+    return ClientError({"Error": {"Code": code, "Message": message}}, "DescribeSourceServers")
+
+
+class TestFanOut:
+    def test_returns_one_active_cell_per_region_in_input_order(self):
+        cells = fan_out(lambda region: f"result-{region}", ["us-east-1", "us-west-2", "eu-west-1"])
+
+        assert [c["region"] for c in cells] == ["us-east-1", "us-west-2", "eu-west-1"]
+        assert all(c["status"] == "ACTIVE" for c in cells)
+        assert cells[1]["result"] == "result-us-west-2"
+        assert cells[1]["errorMessage"] is None
+        assert cells[1]["accountId"] is None
+
+    def test_account_region_matrix_passes_account_to_func(self):
+        accounts = [{"accountId": "111111111111"}, {"accountId": "222222222222"}]
+
+        cells = fan_out(lambda account, region: (account["accountId"], region), ["us-east-1", "us-west-2"], accounts)
+
+        assert len(cells) == 4
+        assert [(c["accountId"], c["region"]) for c in cells] == [c["result"] for c in cells]
+
+    def test_errors_are_classified_per_cell(self):
+        def query(region):
+            if region == "us-west-2":
+                raise _client_error("UninitializedAccountException")
+            return 1
+
+        cells = fan_out(query, ["us-east-1", "us-west-2"])
+
+        assert cells[0]["status"] == "ACTIVE"
+        assert cells[1]["status"] == "NOT_INITIALIZED"
+        assert cells[1]["result"] is None
+
+    def test_unfinished_regions_are_reported_as_timeout(self):
+        release = threading.Event()
+
+        def query(region):
+            if region == "ap-south-1":
+                release.wait(5)
+            return region
+
+        try:
+            cells = fan_out(query, ["us-east-1", "ap-south-1"], deadline=time.monotonic() + 0.2)
+        finally:
+            release.set()
+
+        assert cells[0]["status"] == "ACTIVE"
+        assert cells[1]["status"] == "TIMEOUT"
+        assert cells[1]["result"] is None
+
+    def test_empty_input_returns_no_cells(self):
+        assert fan_out(MagicMock(), []) == []
+
+
+class TestClassifyRegionError:
+    @pytest.mark.parametrize(
+        "code,message,expected",
+        [
+            ("UninitializedAccountException", "Account not initialized", "NOT_INITIALIZED"),
+            ("AccessDeniedException", "not authorized", "IAM_PERMISSION_DENIED"),
+            ("AccessDenied", "explicit deny in a service control policy", "SCP_DENIED"),
+            ("ThrottlingException", "Rate exceeded", "THROTTLED"),
+            ("OptInRequired", "opt in", "REGION_NOT_OPTED_IN"),
+            ("UnrecognizedClientException", "invalid token", "REGION_NOT_ENABLED"),
+            ("InternalServerException", "boom", "ERROR"),
+        ],
+    )
+    def test_client_errors(self, code, message, expected):
+        status, error_message = classify_region_error(_client_error(code, message))
+
+        assert status == expected
+        assert error_message
+
+    def test_endpoint_unreachable(self):
+        error = EndpointConnectionError(endpoint_url="https://drs.me-central-1.amazonaws.com")
+
+        assert classify_region_error(error)[0] == "ENDPOINT_UNREACHABLE"
+
+    def test_generic_error_message_is_truncated(self):
+        status, error_message = classify_region_error(RuntimeError("x" * 1000))
+
+        assert status == "ERROR"
+        assert len(error_message) == 500
+
+
+class TestInvocationDeadline:
+    def test_deadline_derived_from_lambda_context(self):
+        context = MagicMock()
+        context.get_remaining_time_in_millis.return_value = 30000
+
+        set_invocation_deadline(context, safety_margin=5.0)
+
+        assert 24.0 < get_remaining_seconds() <= 25.0
+
+    def test_context_without_remaining_time_uses_default_budget(self):
+        set_invocation_deadline(object())
+
+        assert region_fanout._invocation_deadline is None
+        assert get_remaining_seconds() == DEFAULT_BUDGET_SECONDS
+
+    def test_deadline_is_never_negative(self):
+        context = MagicMock()
+        context.get_remaining_time_in_millis.return_value = 1000
+
+        set_invocation_deadline(context, safety_margin=5.0)
+
+        assert get_remaining_seconds() == 0.0
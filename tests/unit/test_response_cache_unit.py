@@ -0,0 +1,177 @@
+# Copyright Amazon.com and Affiliates. All rights reserved.
+# This deliverable is considered Developed Content as defined in the AWS Service Terms.
+
+"""
+Unit tests for the bounded response cache.
+
+Covers TTL expiry, LRU eviction by entry count and size, namespace
+invalidation, single-flight recompute, stale-while-revalidate and counters.
+"""
+
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Add lambda directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../lambda"))
+
+from shared.response_cache import ResponseCache, clear_all_caches  # noqa: E402
+
+
+@pytest.fixture
+def clock():
+    """Controllable time.monotonic for the cache module."""
+    now = [1000.0]
+    with patch("shared.response_cache.time.monotonic", side_effect=lambda: now[0]):
+        yield now
+
+
+class TestTtlAndEviction:
+    def test_entry_expires_after_its_own_ttl(self, clock):
+        cache = ResponseCache(default_ttl=30)
+        cache.set("ec2_subnets:a", {"x": 1}, ttl=5)
+        cache.set("ec2_subnets:b", {"x": 2})
+
+        clock[0] += 10
+
+        assert cache.get("ec2_subnets:a") is None
+        assert cache.get("ec2_subnets:b") == {"x": 2}
+        assert cache.get_stats()["expirations"] == 1
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = ResponseCache(max_entries=2)
+        cache.set("ns:a", 1)
+        cache.set("ns:b", 2)
+        cache.get("ns:a")
+
+        cache.set("ns:c", 3)
+
+        assert cache.get("ns:a") == 1
+        assert cache.get("ns:b") is None
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_size_bound_evicts_until_within_budget(self):
+        cache = ResponseCache(max_bytes=40)
+        cache.set("ns:a", "x" * 20)
+        cache.set("ns:b", "y" * 20)
+
+        assert cache.get("ns:a") is None
+        assert cache.get("ns:b") == "y" * 20
+        assert cache.get_stats()["bytes"] <= 40
+
+    def test_value_larger_than_cache_is_not_stored(self):
+        cache = ResponseCache(max_bytes=10)
+
+        cache.set("ns:a", "x" * 100)
+
+        assert cache.get_stats()["entries"] == 0
+
+
+class TestInvalidate:
+    def test_namespace_invalidation_only_drops_that_namespace(self):
+        cache = ResponseCache()
+        cache.set("combined_capacity:111111111111", 1)
+        cache.set("combined_capacity:222222222222", 2)
+        cache.set("ec2_subnets:current:us-east-1", 3)
+
+        removed = cache.invalidate("combined_capacity")
+
+        assert removed == 2
+        assert cache.get("ec2_subnets:current:us-east-1") == 3
+        assert cache.get_stats()["entries"] == 1
+
+    def test_clear_all_caches_empties_every_cache(self):
+        first, second = ResponseCache(), ResponseCache()
+        first.set("ns:a", 1)
+        second.set("ns:b", 2)
+
+        clear_all_caches()
+
+        assert first.get_stats()["entries"] == 0
+        assert second.get_stats()["entries"] == 0
+
+
+class TestGetOrCompute:
+    def test_hit_does_not_recompute(self):
+        cache = ResponseCache()
+        compute = MagicMock(return_value={"statusCode": 200})
+
+        cache.get_or_compute("ns:a", compute)
+        cache.get_or_compute("ns:a", compute)
+
+        compute.assert_called_once()
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    def test_uncacheable_results_are_not_stored(self):
+        cache = ResponseCache()
+        compute = MagicMock(return_value={"statusCode": 500})
+
+        for _ in range(2):
+            cache.get_or_compute("ns:a", compute, cacheable=lambda r: r["statusCode"] == 200)
+
+        assert compute.call_count == 2
+
+    def test_concurrent_misses_share_one_computation(self):
+        cache = ResponseCache()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "value"
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [executor.submit(cache.get_or_compute, "ns:a", compute) for _ in range(5)]
+            started.wait(5)
+            time.sleep(0.05)
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert results == ["value"] * 5
+        assert len(calls) == 1
+        assert cache.get_stats()["coalesced"] == 4
+
+    def test_errors_propagate_and_are_not_cached(self):
+        cache = ResponseCache()
+        compute = MagicMock(side_effect=[RuntimeError("boom"), "ok"])
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_compute("ns:a", compute)
+
+        assert cache.get_or_compute("ns:a", compute) == "ok"
+
+    def test_stale_value_is_served_while_refreshing(self, clock):
+        cache = ResponseCache()
+        cache.get_or_compute("ns:a", lambda: "old", ttl=10, stale_ttl=60)
+        clock[0] += 20
+        refreshed = threading.Event()
+
+        def refresh():
+            refreshed.set()
+            return "new"
+
+        assert cache.get_or_compute("ns:a", refresh, ttl=10, stale_ttl=60) == "old"
+        assert refreshed.wait(5)
+        for _ in range(50):
+            if cache.get("ns:a") == "new":
+                break
+            time.sleep(0.01)
+
+        assert cache.get("ns:a") == "new"
+        assert cache.get_stats()["staleHits"] == 1
+
+    def test_entry_past_stale_window_is_recomputed_inline(self, clock):
+        cache = ResponseCache()
+        cache.get_or_compute("ns:a", lambda: "old", ttl=10, stale_ttl=5)
+        clock[0] += 30
+
+        assert cache.get_or_compute("ns:a", lambda: "new") == "new"
@@ -0,0 +1,204 @@
+# Copyright Amazon.com and Affiliates. All rights reserved.
+# This deliverable is considered Developed Content as defined in the AWS Service Terms.
+
+"""
+Unit tests for the DynamoDB-backed shared cache tier.
+
+Covers hit/miss/expiry, namespace generations, compare-and-set conflicts,
+payload compression, the disabled tier and the ResponseCache integration.
+"""
+
+import os
+import sys
+import time
+import zlib
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+# Add lambda directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../lambda"))
+
+from shared.response_cache import ResponseCache  # noqa: E402
+from shared.shared_cache import (  # noqa: E402
+    MAX_PAYLOAD_BYTES,
+    SharedCache,
+    _decode,
+    _encode,
+    invalidate_namespaces,
+    reset_shared_cache,
+)
+
+TABLE_NAME = "test-response-cache"
+
+
+def _item(key, value, version=1, generation=0, expires_in=60):
+    return {
+        "cacheKey": key,
+        "payload": _encode(value),
+        "version": version,
+        "generation": generation,
+        "expiresAt": int(time.time() + expires_in),
+    }
+
+
+@pytest.fixture
+def table():
+    table = MagicMock()
+    table.name = TABLE_NAME
+    table.update_item.return_value = {"Attributes": {"version": 1}}
+    return table
+
+
+@pytest.fixture
+def dynamodb():
+    resource = MagicMock()
+    with patch("shared.shared_cache._get_dynamodb_resource", return_value=resource):
+        yield resource
+
+
+def _respond(dynamodb, *items):
+    dynamodb.batch_get_item.return_value = {"Responses": {TABLE_NAME: list(items)}}
+
+
+class TestGet:
+    def test_hit_returns_decoded_value_and_version(self, table, dynamodb):
+        _respond(dynamodb, _item("ec2_subnets:a", {"subnets": [1, 2]}, version=3))
+
+        entry = SharedCache(table=table).get("ec2_subnets:a")
+
+        assert entry["hit"] is True
+        assert entry["value"] == {"subnets": [1, 2]}
+        assert entry["version"] == 3
+
+    def test_missing_entry_is_a_miss_with_no_version(self, table, dynamodb):
+        _respond(dynamodb)
+
+        entry = SharedCache(table=table).get("ec2_subnets:a")
+
+        assert entry["hit"] is False
+        assert entry["version"] is None
+
+    def test_expired_entry_is_a_miss(self, table, dynamodb):
+        _respond(dynamodb, _item("ec2_subnets:a", {"x": 1}, version=2, expires_in=-1))
+
+        entry = SharedCache(table=table).get("ec2_subnets:a")
+
+        assert entry["hit"] is False
+        assert entry["version"] == 2
+
+    def test_entry_from_older_generation_is_a_miss(self, table, dynamodb):
+        _respond(
+            dynamodb,
+            _item("combined_capacity:1", {"x": 1}, generation=0),
+            {"cacheKey": "__namespace__#combined_capacity", "generation": 1},
+        )
+
+        entry = SharedCache(table=table).get("combined_capacity:1")
+
+        assert entry["hit"] is False
+        assert entry["generation"] == 1
+
+    def test_read_error_returns_none(self, table, dynamodb):
+        dynamodb.batch_get_item.side_effect = Exception("boom")
+
+        cache = SharedCache(table=table)
+
+        assert cache.get("ec2_subnets:a") is None
+        assert cache.get_stats()["errors"] == 1
+
+
+class TestWrite:
+    def test_set_writes_compressed_payload_and_ttl(self, table):
+        version = SharedCache(table=table).set("ec2_subnets:a", {"x": 1}, ttl=60, generation=2)
+
+        kwargs = table.update_item.call_args.kwargs
+        values = kwargs["ExpressionAttributeValues"]
+        assert version == 1
+        assert _decode(values[":payload"]) == {"x": 1}
+        assert values[":generation"] == 2
+        assert values[":ns"] == "ec2_subnets"
+        assert "ConditionExpression" not in kwargs
+
+    def test_compression_round_trip_is_smaller_for_repetitive_payloads(self):
+        value = {"regions": [{"region": "us-east-1", "status": "ACTIVE"}] * 200}
+
+        payload = _encode(value)
+
+        assert _decode(payload) == value
+        assert len(payload) < len(zlib.decompress(payload))
+
+    def test_oversized_payload_is_not_written(self, table):
+        value = {"blob": os.urandom(MAX_PAYLOAD_BYTES).hex()}
+
+        assert SharedCache(table=table).set("ec2_subnets:a", value, ttl=60, generation=0) is None
+        table.update_item.assert_not_called()
+
+    def test_compare_and_set_conflict_returns_false(self, table):
+        table.update_item.side_effect = ClientError(
+            {"Error": {"Code": "ConditionalCheckFailedException", "Message": "nope"}}, "UpdateItem"
+        )
+        cache = SharedCache(table=table)
+
+        assert cache.compare_and_set("ec2_subnets:a", {"x": 1}, 4, ttl=60, generation=0) is False
+        assert cache.get_stats()["conflicts"] == 1
+        assert "ConditionExpression" in table.update_item.call_args.kwargs
+
+    def test_invalidate_namespace_bumps_generation(self, table):
+        SharedCache(table=table).invalidate_namespace("staging_accounts")
+
+        kwargs = table.update_item.call_args.kwargs
+        assert kwargs["Key"] == {"cacheKey": "__namespace__#staging_accounts"}
+        assert "ADD generation :one" in kwargs["UpdateExpression"]
+
+
+class TestDisabledTier:
+    def test_no_table_configured_disables_every_operation(self, monkeypatch):
+        monkeypatch.delenv("RESPONSE_CACHE_TABLE", raising=False)
+        reset_shared_cache()
+        cache = SharedCache()
+
+        assert cache.enabled is False
+        assert cache.get("ec2_subnets:a") is None
+        assert cache.set("ec2_subnets:a", {}, ttl=60) is None
+        assert cache.compare_and_set("ec2_subnets:a", {}, None, ttl=60) is False
+        invalidate_namespaces("ec2_subnets")
+
+
+class TestResponseCacheIntegration:
+    def test_shared_hit_skips_compute(self):
+        shared = MagicMock()
+        shared.get.return_value = {
+            "hit": True,
+            "value": {"v": 1},
+            "version": 1,
+            "expiresAt": time.time() + 60,
+            "generation": 0,
+        }
+        compute = MagicMock()
+        cache = ResponseCache(shared_tier=shared)
+
+        assert cache.get_or_compute("ec2_subnets:a", compute, ttl=30) == {"v": 1}
+        assert cache.get_or_compute("ec2_subnets:a", compute, ttl=30) == {"v": 1}
+        compute.assert_not_called()
+        shared.get.assert_called_once()
+        assert cache.get_stats()["sharedHits"] == 1
+
+    def test_shared_miss_computes_and_compare_and_sets(self):
+        shared = MagicMock()
+        shared.get.return_value = {"hit": False, "value": None, "version": 5, "expiresAt": 0, "generation": 2}
+        cache = ResponseCache(shared_tier=shared)
+
+        assert cache.get_or_compute("ec2_subnets:a", lambda: {"v": 2}, ttl=30) == {"v": 2}
+        shared.compare_and_set.assert_called_once_with("ec2_subnets:a", {"v": 2}, 5, 30, generation=2)
+
+    def test_uncacheable_value_is_not_written_to_shared_tier(self):
+        shared = MagicMock()
+        shared.get.return_value = None
+        cache = ResponseCache(shared_tier=shared)
+
+        cache.get_or_compute("ec2_subnets:a", lambda: {"statusCode": 500}, cacheable=lambda r: False)
+
+        shared.set.assert_not_called()
+        shared.compare_and_set.assert_not_called()
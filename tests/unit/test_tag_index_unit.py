@@ -0,0 +1,157 @@
+# Copyright Amazon.com and Affiliates. All rights reserved.
+# This deliverable is considered Developed Content as defined in the AWS Service Terms.
+
+"""
+Unit tests for the inverted server tag index.
+
+Covers normalization, index rebuilds from DRS listings, AND intersection,
+sync-marker freshness and the fallbacks that keep the DRS API path in use.
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Add lambda directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../lambda"))
+
+from shared.tag_index import (  # noqa: E402
+    get_index_account_id,
+    normalize_tag,
+    resolve_servers_by_tags,
+    sync_tag_index,
+)
+
+ACCOUNT = "111122223333"
+REGION = "us-east-1"
+
+
+class FakeIndexTable:
+    """In-memory stand-in for the tag index table (put/get/query/batch_writer)."""
+
+    def __init__(self):
+        self.items = {}
+
+    def put_item(self, Item):
+        self.items[(Item["tagKey"], Item["sourceServerID"])] = dict(Item)
+
+    def get_item(self, Key):
+        item = self.items.get((Key["tagKey"], Key["sourceServerID"]))
+        return {"Item": item} if item else {}
+
+    def batch_writer(self, **kwargs):
+        table = self
+
+        class _Writer:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def put_item(self, Item):
+                table.put_item(Item)
+
+        return _Writer()
+
+    def query(self, KeyConditionExpression, FilterExpression, **kwargs):
+        tag_key = KeyConditionExpression.get_expression()["values"][1]
+        synced_at = FilterExpression.get_expression()["values"][1]
+        return {
+            "Items": [
+                {"sourceServerID": item["sourceServerID"]}
+                for (key, _), item in self.items.items()
+                if key == tag_key and item["syncedAt"] >= synced_at
+            ]
+        }
+
+
+@pytest.fixture
+def table():
+    table = FakeIndexTable()
+    with patch("shared.tag_index.get_tag_index_table", return_value=table):
+        yield table
+
+
+def _now(minutes_ago=0):
+    return (datetime.now(timezone.utc) - timedelta(minutes=minutes_ago)).isoformat()
+
+
+SERVERS = [
+    {"sourceServerID": "s-1", "tags": {"Environment": "Production", "Tier": "web"}},
+    {"sourceServerID": "s-2", "tags": {" Environment ": "production ", "Tier": "db"}},
+    {"sourceServerID": "s-3", "tags": {"Environment": "dev", "Tier": "web"}},
+]
+
+
+class TestNormalization:
+    def test_strips_key_and_lowercases_value(self):
+        assert normalize_tag(" Environment ", " Production ") == ("Environment", "production")
+
+
+class TestResolve:
+    def test_single_tag_is_case_insensitive_on_values(self, table):
+        sync_tag_index(ACCOUNT, REGION, SERVERS, synced_at=_now())
+
+        assert resolve_servers_by_tags(ACCOUNT, REGION, {"Environment": "PRODUCTION"}) == ["s-1", "s-2"]
+
+    def test_multiple_tags_use_and_semantics(self, table):
+        sync_tag_index(ACCOUNT, REGION, SERVERS, synced_at=_now())
+
+        assert resolve_servers_by_tags(ACCOUNT, REGION, {"Environment": "production", "Tier": "web"}) == ["s-1"]
+
+    def test_no_match_returns_empty_list(self, table):
+        sync_tag_index(ACCOUNT, REGION, SERVERS, synced_at=_now())
+
+        assert resolve_servers_by_tags(ACCOUNT, REGION, {"Environment": "staging"}) == []
+
+    def test_tag_removed_since_last_sync_no_longer_matches(self, table):
+        sync_tag_index(ACCOUNT, REGION, SERVERS, synced_at=_now(minutes_ago=10))
+        sync_tag_index(ACCOUNT, REGION, SERVERS[1:], synced_at=_now())
+
+        assert resolve_servers_by_tags(ACCOUNT, REGION, {"Tier": "web"}) == ["s-3"]
+
+    def test_index_is_partitioned_by_account_and_region(self, table):
+        sync_tag_index(ACCOUNT, REGION, SERVERS, synced_at=_now())
+        sync_tag_index(ACCOUNT, "us-west-2", [], synced_at=_now())
+
+        assert resolve_servers_by_tags(ACCOUNT, "us-west-2", {"Tier": "web"}) == []
+        assert resolve_servers_by_tags("444455556666", REGION, {"Tier": "web"}) is None
+
+
+class TestFallback:
+    def test_unsynced_region_returns_none(self, table):
+        assert resolve_servers_by_tags(ACCOUNT, REGION, {"Tier": "web"}) is None
+
+    def test_stale_marker_returns_none(self, table):
+        sync_tag_index(ACCOUNT, REGION, SERVERS, synced_at=_now(minutes_ago=120))
+
+        assert resolve_servers_by_tags(ACCOUNT, REGION, {"Tier": "web"}) is None
+
+    def test_empty_tags_return_none(self, table):
+        sync_tag_index(ACCOUNT, REGION, SERVERS, synced_at=_now())
+
+        assert resolve_servers_by_tags(ACCOUNT, REGION, {}) is None
+
+    def test_read_error_returns_none(self):
+        table = MagicMock()
+        table.get_item.side_effect = Exception("boom")
+        with patch("shared.tag_index.get_tag_index_table", return_value=table):
+            assert resolve_servers_by_tags(ACCOUNT, REGION, {"Tier": "web"}) is None
+
+    def test_unconfigured_table_disables_index(self):
+        with patch("shared.tag_index.get_tag_index_table", return_value=None):
+            assert sync_tag_index(ACCOUNT, REGION, SERVERS) == 0
+            assert resolve_servers_by_tags(ACCOUNT, REGION, {"Tier": "web"}) is None
+
+
+class TestAccountResolution:
+    def test_account_context_id_is_used(self):
+        assert get_index_account_id({"accountId": ACCOUNT}) == ACCOUNT
+
+    def test_missing_context_uses_current_account(self):
+        with patch("shared.cross_account.get_current_account_id", return_value="999988887777"):
+            assert get_index_account_id(None) == "999988887777"